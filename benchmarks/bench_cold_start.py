@@ -0,0 +1,135 @@
+"""
+Cold-start benchmark of the ``score`` entry point.
+
+Builds two tiny scoring bundles from synthetic data, then times
+``python -m courier_churn score`` end to end on a 4-row CSV in fresh
+interpreters: CLI start, bundle unpickling, preprocessing, scoring and
+writing the output.
+
+- best_xgb: the full XGBoost bundle (xgboost and sklearn are loaded by
+  unpickling the model, scaler and PLS).
+- student: the distilled bundle (compiled logistic student + compiled PLS),
+  which must load without sklearn or any model library.
+
+Usage:
+    python benchmarks/bench_cold_start.py [--repeats 10]
+
+Exits with status 1 if a median cold start exceeds its budget, or if a
+forbidden module is imported on a bundle's scoring path.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+
+from courier_churn.config import NUMERIC_FEATURES
+
+# Median end-to-end `courier-churn score` budgets (seconds) per bundle
+BUDGETS_S = {"best_xgb": 2.5, "student": 1.0}
+
+# Modules that must not be imported while scoring with each bundle
+FORBIDDEN_MODULES = {
+    "best_xgb": ["matplotlib", "seaborn", "shap", "optuna", "lightgbm", "catboost"],
+    "student": ["matplotlib", "seaborn", "shap", "optuna", "lightgbm", "catboost",
+                "xgboost", "sklearn"],
+}
+
+
+def make_cleaned_data(n: int = 400, seed: int = 0) -> pd.DataFrame:
+    """Synthetic rows in the cleaned dataset format."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(NUMERIC_FEATURES))), columns=NUMERIC_FEATURES)
+    df["courier_id"] = np.arange(n)
+    df["movement_type"] = rng.choice(["bike", "car", "foot"], n)
+    df["hiring_channel_name"] = rng.choice(["A", "B", "Unknown"], n)
+    df["region_id"] = rng.choice([10, 20, 30], n)
+    df["first_order_delivered"] = pd.Timestamp("2024-01-01") + pd.to_timedelta(rng.integers(0, 400, n), unit="D")
+    df["churn_flag"] = (df["active_days_7d"] + rng.normal(size=n) > 0).astype(int)
+    return df
+
+
+def build_bundles(workdir: str) -> dict:
+    """Trains tiny teacher and student bundles; returns name -> bundle path."""
+    from courier_churn.distill import distill, make_student_bundle
+    from courier_churn.features import prepare_features
+    from courier_churn.pls import fit_pls
+    from courier_churn.train import make_best_xgb
+
+    df = make_cleaned_data()
+    df_final, scaler, pls = fit_pls(df)
+    df_final = df_final.drop(columns=["courier_id"])
+    X_train, y_train, X_test, y_test, encoding = prepare_features(df_final, df_final)
+
+    teacher = make_best_xgb(n_estimators=20)
+    teacher.fit(X_train, y_train)
+    bundle = {"model": teacher, "encoding": encoding, "scaler": scaler, "pls": pls,
+              "numeric_features": NUMERIC_FEATURES}
+    _, students = distill(teacher, X_train, X_test, y_test, n_latency_rows=1)
+
+    paths = {}
+    for name, content in [("best_xgb", bundle), ("student", make_student_bundle(bundle, students["compiled"]))]:
+        paths[name] = os.path.join(workdir, f"{name}.joblib")
+        joblib.dump(content, paths[name])
+
+    df.drop(columns=["churn_flag"]).head(4).to_csv(os.path.join(workdir, "input.csv"), index=False)
+    return paths
+
+
+def score_command(workdir: str, bundle_path: str, extra: list = ()) -> list:
+    """Command line of an end-to-end score run."""
+    return [sys.executable, *extra, "-m", "courier_churn", "score",
+            "--input", os.path.join(workdir, "input.csv"),
+            "--output", os.path.join(workdir, "output.csv"),
+            "--model", bundle_path]
+
+
+def imported_modules(workdir: str, bundle_path: str) -> set:
+    """Top-level modules imported by one score run (from -X importtime)."""
+    result = subprocess.run(score_command(workdir, bundle_path, ["-X", "importtime"]),
+                            capture_output=True, text=True, check=True)
+    return {line.rsplit("|", 1)[-1].strip().split(".")[0]
+            for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+def time_score(workdir: str, bundle_path: str, repeats: int) -> float:
+    """Median wall time of end-to-end score runs in fresh interpreters."""
+    timings = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        subprocess.run(score_command(workdir, bundle_path), capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=10)
+    args = parser.parse_args()
+
+    failed = False
+    with tempfile.TemporaryDirectory() as workdir:
+        paths = build_bundles(workdir)
+        for name, path in paths.items():
+            wall = time_score(workdir, path, args.repeats)
+            forbidden = sorted(imported_modules(workdir, path) & set(FORBIDDEN_MODULES[name]))
+            ok = wall <= BUDGETS_S[name] and not forbidden
+            failed |= not ok
+            print(f"{'✅' if ok else '❌'} score with {name}: {wall:.3f}s median end to end "
+                  f"(budget {BUDGETS_S[name]:.1f}s, {args.repeats} runs)")
+            if forbidden:
+                print(f"   forbidden modules imported: {', '.join(forbidden)}")
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
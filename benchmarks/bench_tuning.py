@@ -0,0 +1,73 @@
+"""
+Multi-fidelity tuning benchmark.
+
+Runs the full-fidelity Optuna search, then gives a successive-halving or
+Hyperband search the same wall-time budget, and reports how long each one
+took to reach the best F1 of the full-fidelity search.
+
+Usage:
+    python benchmarks/bench_tuning.py [--train train_churn_PLS.csv]
+        [--test test_churn_PLS.csv] [--n-trials 50] [--pruner hyperband]
+"""
+
+import argparse
+import time
+
+import optuna
+
+from courier_churn import config
+from courier_churn.features import load_train_test
+from courier_churn.tune import run_study
+
+
+class TimeToTarget:
+    """Optuna callback recording when the best value first reaches a target."""
+
+    def __init__(self, target: float = None):
+        self.target = target
+        self.start = time.perf_counter()
+        self.reached_s = None
+
+    def __call__(self, study: optuna.Study, trial: optuna.trial.FrozenTrial) -> None:
+        completed = trial.state == optuna.trial.TrialState.COMPLETE
+        if (self.reached_s is None and self.target is not None and completed
+                and study.best_value >= self.target):
+            self.reached_s = time.perf_counter() - self.start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--train", default=config.TRAIN_PATH)
+    parser.add_argument("--test", default=config.TEST_PATH)
+    parser.add_argument("--n-trials", type=int, default=50)
+    parser.add_argument("--pruner", choices=["sha", "hyperband"], default="hyperband")
+    parser.add_argument("--seed", type=int, default=42, help="Sampler seed shared by both searches.")
+    args = parser.parse_args()
+
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    X_train, y_train, _, _, _ = load_train_test(args.train, args.test)
+
+    start = time.perf_counter()
+    full = run_study(X_train, y_train, n_trials=args.n_trials, seed=args.seed)
+    full_s = time.perf_counter() - start
+    target = full.best_value
+
+    # Same compute: the multi-fidelity search gets the full search's wall time
+    tracker = TimeToTarget(target)
+    multi = run_study(X_train, y_train, n_trials=None, pruner=args.pruner,
+                      timeout=full_s, callbacks=[tracker], seed=args.seed)
+
+    states = [trial.state for trial in multi.trials]
+    n_pruned = sum(state == optuna.trial.TrialState.PRUNED for state in states)
+    print(f"full fidelity : best F1 {target:.4f} after {args.n_trials} trials in {full_s:.1f}s")
+    print(f"{args.pruner:<14}: best F1 {multi.best_value:.4f} over {len(states)} trials "
+          f"({n_pruned} pruned) in the same budget")
+    if tracker.reached_s is None:
+        print(f"{args.pruner} did not reach F1 {target:.4f} within the budget")
+    else:
+        print(f"{args.pruner} reached F1 {target:.4f} after {tracker.reached_s:.1f}s "
+              f"({tracker.reached_s / full_s:.0%} of the full-fidelity time)")
+
+
+if __name__ == "__main__":
+    main()
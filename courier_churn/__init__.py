@@ -0,0 +1,14 @@
+"""
+Courier churn prediction.
+
+The pipeline is split into stages that communicate through files, each
+available as a subcommand of ``python -m courier_churn`` (or ``courier-churn``):
+
+    ingest -> clean -> pls -> train / tune -> score / report
+
+Modules import their heavy dependencies (plotting, SHAP, boosting libraries,
+Optuna) only when the corresponding stage runs, so importing the package or
+running ``score`` stays cheap.
+"""
+
+__version__ = "0.1.0"
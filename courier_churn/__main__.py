@@ -0,0 +1,4 @@
+from courier_churn.cli import main
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+Parallel rolling-origin backtesting over snapshot dates.
+
+For each snapshot date the features are rebuilt as of that date (account age
+is measured against the snapshot), the model is trained on couriers known at
+that date and scored on couriers who appear in the following period. Snapshots
+and fitted preprocessing are cached on disk and folds run in parallel.
+
+Label and cohort semantics: the dataset holds a single extraction, so every
+fold trains and evaluates on the final churn_flag, which is observed after the
+extraction date and therefore after the fold's test date; activity windows
+(num_orders_30d, ...) are likewise as of extraction, not as of the snapshot.
+The scored rows are only the couriers first seen between the two snapshot
+dates. A fold therefore measures how well a model trained on the couriers
+known at a date ranks the next cohort of new couriers by their eventual
+churn; it is not a month-over-month performance estimate for the whole base.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+from joblib import Memory, Parallel, delayed
+from sklearn.cross_decomposition import PLSRegression
+from sklearn.metrics import f1_score, precision_score, recall_score, roc_auc_score
+from sklearn.preprocessing import StandardScaler
+
+from courier_churn.config import ONE_HOT_FEATURES
+from courier_churn.features import add_account_age, apply_pls, encode_regions
+
+
+def build_snapshot(data_path: str, data_mtime: float, as_of: pd.Timestamp) -> pd.DataFrame:
+    """
+    Builds the feature snapshot of the couriers known at a given date.
+
+    Parameters
+    ----------
+    data_path : str
+        Path to the cleaned dataset (output of load_and_clean_dataset).
+    data_mtime : float
+        Modification time of the file; part of the cache key only.
+    as_of : pd.Timestamp
+        Snapshot date.
+
+    Returns
+    -------
+    pd.DataFrame
+        Couriers with a first delivered order before as_of, with
+        account_age_days measured as of the snapshot date.
+    """
+    df = pd.read_csv(data_path, parse_dates=["first_order_delivered"])
+    snapshot = df[df["first_order_delivered"] < as_of]
+    return add_account_age(snapshot, as_of).reset_index(drop=True)
+
+
+def fit_preprocessing(snapshot_fn, data_path: str, data_mtime: float, as_of: pd.Timestamp,
+                      numeric_features: tuple, n_components: int = 15) -> dict:
+    """
+    Fits the scaler, PLS and categorical encodings on a training snapshot.
+
+    Returns
+    -------
+    dict
+        Fitted scaler and PLS, dummy columns and known region levels.
+    """
+    train = snapshot_fn(data_path, data_mtime, as_of)
+    numeric_features = list(numeric_features)
+
+    scaler = StandardScaler()
+    X_scaled = scaler.fit_transform(train[numeric_features])
+    pls = PLSRegression(n_components=min(len(numeric_features), n_components))
+    pls.fit(X_scaled, train["churn_flag"])
+
+    dummies = pd.get_dummies(train[ONE_HOT_FEATURES], columns=ONE_HOT_FEATURES, drop_first=True)
+    return {
+        "scaler": scaler,
+        "pls": pls,
+        "dummy_columns": dummies.columns.tolist(),
+        "regions": np.sort(train["region_id"].unique())
+    }
+
+
+def encode_snapshot(snapshot: pd.DataFrame, prep: dict, numeric_features: list) -> tuple:
+    """
+    Applies fitted preprocessing to a snapshot, mirroring the main pipeline:
+    PLS scores, one-hot categoricals and a label-encoded region_id.
+
+    Returns
+    -------
+    tuple
+        (X, y) ready for the model.
+    """
+    df = apply_pls(snapshot, prep["scaler"], prep["pls"], numeric_features)
+    y = df["churn_flag"].reset_index(drop=True)
+
+    # Keep every level so that a fold missing a category is not shifted by drop_first
+    X = pd.get_dummies(df.drop(columns=["courier_id", "churn_flag"]), columns=ONE_HOT_FEATURES)
+    other_columns = [col for col in X.columns
+                     if not col.startswith(tuple(f"{name}_" for name in ONE_HOT_FEATURES))]
+    X = X.reindex(columns=other_columns + prep["dummy_columns"], fill_value=0)
+    X["region_id"] = encode_regions(X["region_id"], prep["regions"])
+    return X.reset_index(drop=True), y
+
+
+def _warm_snapshot(snapshot_fn, data_path: str, data_mtime: float, as_of: pd.Timestamp) -> None:
+    """Materializes a snapshot in the cache without shipping it back to the parent."""
+    snapshot_fn(data_path, data_mtime, as_of)
+
+
+def run_fold(snapshot_fn, prep_fn, data_path: str, data_mtime: float,
+             train_date: pd.Timestamp, test_date: pd.Timestamp,
+             numeric_features: list, make_model) -> dict:
+    """
+    Runs one backtest fold: trains on the snapshot at train_date and scores
+    the new couriers first seen in (train_date, test_date], both against the
+    final churn_flag of the extraction.
+
+    Returns
+    -------
+    dict
+        Fold sizes and metrics on the new-courier cohort.
+    """
+    train = snapshot_fn(data_path, data_mtime, train_date)
+    test = snapshot_fn(data_path, data_mtime, test_date)
+    test = test[~test["courier_id"].isin(train["courier_id"])]
+
+    fold = {
+        "Snapshot": train_date.date(),
+        "New couriers until": test_date.date(),
+        "Known couriers trained": len(train),
+        "New couriers scored": len(test),
+        "New courier churn rate": test["churn_flag"].mean() if len(test) else np.nan
+    }
+    if train["churn_flag"].nunique() < 2 or test["churn_flag"].nunique() < 2:
+        return fold
+
+    prep = prep_fn(snapshot_fn, data_path, data_mtime, train_date, tuple(numeric_features))
+    X_train_fold, y_train_fold = encode_snapshot(train, prep, numeric_features)
+    X_test_fold, y_test_fold = encode_snapshot(test, prep, numeric_features)
+
+    model = make_model()
+    model.fit(X_train_fold, y_train_fold)
+    y_proba = model.predict_proba(X_test_fold)[:, 1]
+    y_pred = (y_proba >= 0.5).astype(int)
+
+    fold.update({
+        "AUC-ROC": roc_auc_score(y_test_fold, y_proba),
+        "F1-score (1)": f1_score(y_test_fold, y_pred),
+        "Precision (1)": precision_score(y_test_fold, y_pred, zero_division=0),
+        "Recall (1)": recall_score(y_test_fold, y_pred)
+    })
+    return fold
+
+
+def run_backtest(data_path: str, snapshot_dates, numeric_features: list, make_model,
+                 cache_dir: str = ".backtest_cache", n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Runs a rolling-origin backtest over consecutive snapshot dates.
+
+    Parameters
+    ----------
+    data_path : str
+        Path to the cleaned dataset with first_order_delivered.
+    snapshot_dates : sequence of dates
+        Ordered snapshot dates; each consecutive pair forms one fold. The last
+        date should be the extraction date so that the newest cohort is scored.
+    numeric_features : list
+        Numeric features fed into the scaler and PLS.
+    make_model : callable
+        Picklable factory returning an unfitted classifier.
+    cache_dir : str
+        Directory of the on-disk snapshot/preprocessing cache.
+    n_jobs : int
+        Number of worker processes (-1 uses all cores).
+
+    Returns
+    -------
+    pd.DataFrame
+        One row of metrics per fold, computed on the new-courier cohort
+        against the final churn labels.
+    """
+    snapshot_dates = [pd.Timestamp(date) for date in snapshot_dates]
+    data_mtime = os.path.getmtime(data_path)
+
+    memory = Memory(cache_dir, verbose=0)
+    snapshot_fn = memory.cache(build_snapshot)
+    prep_fn = memory.cache(fit_preprocessing, ignore=["snapshot_fn"])
+
+    # Each snapshot is shared by two folds, so build them once before the folds start
+    Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(_warm_snapshot)(snapshot_fn, data_path, data_mtime, date)
+        for date in snapshot_dates
+    )
+
+    folds = Parallel(n_jobs=n_jobs, backend="loky")(
+        delayed(run_fold)(snapshot_fn, prep_fn, data_path, data_mtime,
+                          train_date, test_date, numeric_features, make_model)
+        for train_date, test_date in zip(snapshot_dates[:-1], snapshot_dates[1:])
+    )
+    return pd.DataFrame(folds)
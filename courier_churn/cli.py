@@ -0,0 +1,414 @@
+"""
+Command-line entry points, one subcommand per pipeline stage.
+
+Every handler imports its stage module lazily so that a command only pays for
+the libraries it actually uses.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from courier_churn import config
+
+
+def _artifact(args, name: str) -> str:
+    """Returns the path of an artifact inside the artifacts directory."""
+    return os.path.join(args.artifacts, name)
+
+
+def _model_path(args) -> str:
+    """Returns --model, defaulting to the best model bundle in the artifacts directory."""
+    return args.model or _artifact(args, "best_xgb.joblib")
+
+
+def cmd_ingest(args) -> None:
+    from courier_churn.data import load_and_fix_dates
+
+    load_and_fix_dates(input_path=args.input, output_path=args.output)
+
+
+def cmd_clean(args) -> None:
+    from courier_churn.data import load_and_clean_dataset
+
+    df = load_and_clean_dataset(args.input)
+    df.to_csv(args.output, index=False)
+    print(f"✅ Cleaned dataset saved to '{args.output}'. Shape: {df.shape}")
+
+    if args.eda:
+        from courier_churn.eda import explore_data, plot_feature_distributions
+
+        explore_data(df)
+        plot_feature_distributions(df, "feature_distributions_positive_only.png")
+
+
+def cmd_pls(args) -> None:
+    import joblib
+    import pandas as pd
+
+    from courier_churn.drift import DriftMonitor
+    from courier_churn.pls import fit_pls, split_train_test
+
+    df = pd.read_csv(args.input)
+    df_final, scaler, pls = fit_pls(df, n_components=args.n_components)
+    df_final.to_csv(args.output, index=False)
+    print(f"✅ Final dataset saved to '{args.output}'. Shape: {df_final.shape}")
+
+    os.makedirs(args.artifacts, exist_ok=True)
+    joblib.dump({"scaler": scaler, "pls": pls, "numeric_features": config.NUMERIC_FEATURES},
+                _artifact(args, "pls.joblib"))
+
+    # Store the drift reference on the same data the scaler and PLS were fitted on
+    monitor = DriftMonitor(n_bins=args.drift_bins).fit(
+        df, config.NUMERIC_FEATURES, scaler, pls, config.CATEGORICAL_FEATURES)
+    joblib.dump(monitor, _artifact(args, "drift.joblib"))
+    split_train_test(df_final, args.train, args.test)
+
+
+def _retrain_sharded(args) -> None:
+    """Refits only the due (or newly eligible) shards of the saved sharded bundle."""
+    import joblib
+    import pandas as pd
+    from sklearn.metrics import roc_auc_score
+
+    from courier_churn.features import encode_for_scoring
+
+    bundle = joblib.load(_artifact(args, "sharded.joblib"))
+    sharded_model = bundle["model"]
+
+    # Encode with the saved encoding so that region codes keep routing to the same shards
+    df_train, df_test = pd.read_csv(args.train), pd.read_csv(args.test)
+    X_train = encode_for_scoring(df_train, bundle["encoding"], args.as_of)
+    X_test = encode_for_scoring(df_test, bundle["encoding"], args.as_of)
+
+    retrained = sharded_model.retrain(X_train, df_train["churn_flag"])
+    if not retrained:
+        print("No shard is due for retraining.")
+        return
+
+    sharded_auc = roc_auc_score(df_test["churn_flag"], sharded_model.predict_proba(X_test)[:, 1])
+    print(f"Retrained shard(s) {retrained}; {len(sharded_model.shards) - 1} regional shard(s) in total.")
+    print(f"🔹 AUC-ROC sharded: {sharded_auc:.4f}")
+    joblib.dump(bundle, _artifact(args, "sharded.joblib"))
+
+
+def cmd_train(args) -> None:
+    import joblib
+
+    if args.retrain:
+        if not args.sharded:
+            sys.exit("courier-churn train: error: --retrain requires --sharded")
+        _retrain_sharded(args)
+        return
+
+    from courier_churn.features import load_train_test
+    from courier_churn.train import (evaluate_model, make_best_xgb, make_models, train_baselines,
+                                     train_best_xgb)
+
+    X_train, y_train, X_test, y_test, encoding = load_train_test(args.train, args.test, args.as_of)
+
+    if args.baselines:
+        df_results, roc_data, test_predictions = train_baselines(
+            make_models(), X_train, y_train, X_test, y_test)
+        print(df_results.round(3).to_string(index=False))
+        if args.plot:
+            from courier_churn.report import plot_confusion_matrix, plot_metrics_table, plot_roc_curves
+
+            plot_roc_curves(roc_data)
+            plot_metrics_table(df_results, "Model Comparison Metrics")
+            for name, y_pred in test_predictions.items():
+                plot_confusion_matrix(y_test, y_pred, name)
+
+    # Train the model with the best hyperparameters and bundle it for scoring
+    best_xgb = train_best_xgb(X_train, y_train)
+    summary, _, _ = evaluate_model(best_xgb, X_test, y_test)
+    print(f"🔹 Best XGBoost test metrics: {summary}")
+
+    bundle = {"model": best_xgb, "encoding": encoding, **joblib.load(_artifact(args, "pls.joblib"))}
+    joblib.dump(bundle, _artifact(args, "best_xgb.joblib"))
+    print(f"✅ Scoring bundle saved to '{_artifact(args, 'best_xgb.joblib')}'.")
+
+    if args.sharded:
+        from functools import partial
+
+        from sklearn.metrics import roc_auc_score
+
+        from courier_churn.sharding import ShardedChurnModel
+
+        # n_jobs=1 per shard avoids oversubscription across worker processes
+        sharded_model = ShardedChurnModel(partial(make_best_xgb, n_jobs=1),
+                                          min_shard_size=args.min_shard_size)
+        sharded_model.fit(X_train, y_train)
+        sharded_auc = roc_auc_score(y_test, sharded_model.predict_proba(X_test)[:, 1])
+        print(f"Trained {len(sharded_model.shards) - 1} regional shard(s) plus the global fallback.")
+        print(f"🔹 AUC-ROC sharded: {sharded_auc:.4f} vs global: {summary['AUC-ROC']:.4f}")
+        joblib.dump({**bundle, "model": sharded_model}, _artifact(args, "sharded.joblib"))
+
+
+def cmd_tune(args) -> None:
+    from courier_churn.features import load_train_test
+    from courier_churn.tune import reduction_factor, run_study
+
+    if args.pruner != "none":
+        try:
+            reduction_factor(args.fractions)
+        except ValueError as error:
+            sys.exit(f"courier-churn tune: error: --fractions: {error}")
+
+    X_train, y_train, _, _, _ = load_train_test(args.train, args.test, args.as_of)
+    study = run_study(X_train, y_train, n_trials=args.n_trials, pruner=args.pruner,
+                      fractions=tuple(args.fractions), timeout=args.timeout)
+
+    # Display best result
+    print("Best hyperparameters found by Optuna:")
+    print(study.best_params)
+
+
+def cmd_score(args) -> None:
+    from courier_churn.score import score_file
+
+    n_rows = score_file(args.input, args.output, _model_path(args), args.as_of, args.chunksize)
+    print(f"✅ Scored {n_rows} rows into '{args.output}'.")
+
+
+def cmd_rank(args) -> None:
+    from courier_churn.ranking import rank_file
+
+    df_top = rank_file(args.input, _model_path(args), k=args.k, by=args.by,
+                       reference_date=args.as_of, chunksize=args.chunksize, n_jobs=args.n_jobs)
+    df_top.to_csv(args.output, index=False)
+    print(f"✅ Top-{args.k} at-risk couriers per {', '.join(args.by)} saved to '{args.output}'.")
+
+
+def cmd_report(args) -> None:
+    import joblib
+    import pandas as pd
+    from sklearn.metrics import classification_report
+
+    from courier_churn.features import load_train_test
+    from courier_churn.pls import top_pls_contributors
+    from courier_churn.report import (plot_confusion_matrix, plot_metrics_table,
+                                      plot_roc_curve, plot_shap_pls)
+    from courier_churn.train import evaluate_model
+
+    bundle = joblib.load(_model_path(args))
+    _, _, X_test, y_test, _ = load_train_test(args.train, args.test, args.as_of)
+    summary, y_pred, y_pred_proba = evaluate_model(bundle["model"], X_test, y_test)
+
+    print("🔹 Classification Report on Test Set:")
+    print(classification_report(y_test, y_pred))
+    print(f"🔹 AUC-ROC Score: {summary['AUC-ROC']:.4f}")
+
+    plot_roc_curve(y_test, y_pred_proba, summary["AUC-ROC"], "XGBoost")
+    plot_confusion_matrix(y_test, y_pred, "XGBoost")
+    plot_metrics_table(pd.DataFrame([summary]).round(3), "XGBoost Test Set Performance Metrics")
+    plot_shap_pls(bundle["model"], X_test)
+
+    print(f"Top 20 original features contributing to {args.component}:")
+    print(top_pls_contributors(bundle["pls"], args.component, numeric_features=bundle["numeric_features"])
+          .to_frame(name=f"Weight in {args.component}"))
+
+
+def cmd_distill(args) -> None:
+    import joblib
+
+    from courier_churn.distill import distill, make_student_bundle
+    from courier_churn.features import load_train_test
+
+    bundle = joblib.load(_model_path(args))
+    X_train, _, X_test, y_test, _ = load_train_test(args.train, args.test, args.as_of)
+    df_distillation, students = distill(bundle["model"], X_train, X_test, y_test)
+
+    print("🔹 Teacher vs student comparison on the test set:")
+    print(df_distillation.to_string(index=False))
+
+    # `score --model <artifacts>/student.joblib` scores with the compiled student
+    joblib.dump(make_student_bundle(bundle, students["compiled"]), _artifact(args, "student.joblib"))
+    print(f"✅ Student scoring bundle saved to '{_artifact(args, 'student.joblib')}'.")
+
+
+def cmd_importance(args) -> None:
+    import joblib
+    import pandas as pd
+
+    from courier_churn.features import apply_pls, encode_for_scoring, load_train_test
+    from courier_churn.importance import compute_importance, original_feature_map
+
+    bundle = joblib.load(_model_path(args))
+    if args.input:
+        # Cleaned held-out data also allows ranking the original numeric features
+        df = pd.read_csv(args.input)
+        X = encode_for_scoring(apply_pls(df, bundle["scaler"], bundle["pls"], bundle["numeric_features"]),
+                               bundle["encoding"], args.as_of)
+        y = df["churn_flag"]
+        original = original_feature_map(df, bundle["scaler"], bundle["pls"],
+                                        bundle["numeric_features"], X.columns.tolist())
+    else:
+        _, _, X, y, _ = load_train_test(args.train, args.test, args.as_of)
+        original = None
+
+    df_importance = compute_importance(bundle["model"], X, y, n_repeats=args.n_repeats,
+                                       original=original, n_jobs=args.n_jobs)
+    for method, df_method in df_importance.groupby("method"):
+        print(f"🔹 {method} importance (AUC drop):")
+        print(df_method.head(args.top).round(4).to_string(index=False))
+    df_importance.to_csv(_artifact(args, "importance.csv"), index=False)
+
+
+def cmd_drift(args) -> None:
+    import joblib
+    import pandas as pd
+
+    # Reference bins were stored by the pls stage; only stream updates here
+    monitor = joblib.load(_artifact(args, "drift.joblib"))
+
+    # Stream the scoring data through the monitor chunk by chunk
+    for chunk in pd.read_csv(args.input, chunksize=args.chunksize):
+        monitor.update(chunk)
+
+    drift_alerts = monitor.alerts()
+    print(f"Drift check over {monitor.n_rows} rows: {len(drift_alerts)} feature(s) flagged.")
+    if not drift_alerts.empty:
+        print(drift_alerts.to_string(index=False))
+
+
+def cmd_backtest(args) -> None:
+    from functools import partial
+
+    import pandas as pd
+
+    from courier_churn.backtest import run_backtest
+    from courier_churn.train import make_best_xgb
+
+    dates = pd.date_range(end=args.as_of, periods=args.periods + 1, freq=args.freq)
+    if dates[-1] < pd.Timestamp(args.as_of):
+        # End on --as-of itself so that couriers who started after the last period start are scored
+        dates = dates[1:].append(pd.DatetimeIndex([args.as_of]))
+    df_backtest = run_backtest(args.input, dates, config.NUMERIC_FEATURES,
+                               partial(make_best_xgb, n_jobs=1),
+                               cache_dir=args.cache_dir, n_jobs=args.n_jobs)
+    print("🔹 Rolling-origin backtest (new-courier cohorts, final churn labels):")
+    print(df_backtest.round(3).to_string(index=False))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the argument parser with one subcommand per stage."""
+    parser = argparse.ArgumentParser(prog="courier-churn", description="Courier churn prediction pipeline.")
+    parser.add_argument("--as-of", type=datetime.fromisoformat, default=config.REFERENCE_DATE,
+                        help="Date account age is measured against (YYYY-MM-DD).")
+    parser.add_argument("--artifacts", default=config.ARTIFACTS_DIR,
+                        help="Directory of fitted preprocessing and model artifacts.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("ingest", help="Convert first_order_delivered to dates.")
+    p.add_argument("--input", default=config.RAW_DATA_PATH)
+    p.add_argument("--output", default=config.FIXED_DATA_PATH)
+    p.set_defaults(func=cmd_ingest)
+
+    p = subparsers.add_parser("clean", help="Clean the dataset (optionally run EDA).")
+    p.add_argument("--input", default=config.FIXED_DATA_PATH)
+    p.add_argument("--output", default=config.CLEANED_DATA_PATH)
+    p.add_argument("--eda", action="store_true", help="Show EDA plots.")
+    p.set_defaults(func=cmd_clean)
+
+    p = subparsers.add_parser("pls", help="Standardize, fit PLS and split train/test.")
+    p.add_argument("--input", default=config.CLEANED_DATA_PATH)
+    p.add_argument("--output", default=config.PLS_DATA_PATH)
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--n-components", type=int, default=15)
+    p.add_argument("--drift-bins", type=int, default=10, help="Quantile bins of the drift reference.")
+    p.set_defaults(func=cmd_pls)
+
+    p = subparsers.add_parser("train", help="Train the best model and save the scoring bundle.")
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--baselines", action="store_true", help="Also train and compare baseline models.")
+    p.add_argument("--plot", action="store_true", help="Plot baseline comparison.")
+    p.add_argument("--sharded", action="store_true", help="Also train per-region shards.")
+    p.add_argument("--min-shard-size", type=int, default=1000)
+    p.add_argument("--retrain", action="store_true",
+                   help="With --sharded: refit only the due or newly eligible shards of "
+                        "<artifacts>/sharded.joblib instead of training everything from scratch.")
+    p.set_defaults(func=cmd_train)
+
+    p = subparsers.add_parser("tune", help="Search hyperparameters with Optuna.")
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--n-trials", type=int, default=50)
+    p.add_argument("--timeout", type=float, help="Wall-time budget in seconds.")
+    p.add_argument("--pruner", choices=["none", "sha", "hyperband"], default="none",
+                   help="Multi-fidelity mode: train on growing subsamples and prune early.")
+    p.add_argument("--fractions", type=float, nargs="+", default=[1 / 9, 1 / 3, 1.0],
+                   help="Training-data fractions of the rungs: ascending, ending at 1, same integer ratio.")
+    p.set_defaults(func=cmd_tune)
+
+    p = subparsers.add_parser("score", help="Score cleaned courier data.")
+    p.add_argument("--input", required=True, help="Cleaned CSV to score.")
+    p.add_argument("--output", required=True, help="CSV of courier_id, churn_proba.")
+    p.add_argument("--model", help="Scoring bundle (default: <artifacts>/best_xgb.joblib).")
+    p.add_argument("--chunksize", type=int, default=50_000)
+    p.set_defaults(func=cmd_score)
+
+    p = subparsers.add_parser("rank", help="Top-K at-risk couriers per group.")
+    p.add_argument("--input", required=True, help="Cleaned CSV to score.")
+    p.add_argument("--output", required=True, help="CSV of the top-K lists.")
+    p.add_argument("--model", help="Scoring bundle (default: <artifacts>/best_xgb.joblib).")
+    p.add_argument("--k", type=int, default=100)
+    p.add_argument("--by", nargs="+", default=["region_id", "hiring_channel_name"])
+    p.add_argument("--chunksize", type=int, default=50_000)
+    p.add_argument("--n-jobs", type=int, default=-1)
+    p.set_defaults(func=cmd_rank)
+
+    p = subparsers.add_parser("report", help="Evaluation plots and feature insight.")
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--model", help="Scoring bundle (default: <artifacts>/best_xgb.joblib).")
+    p.add_argument("--component", default="PLS_12")
+    p.set_defaults(func=cmd_report)
+
+    p = subparsers.add_parser("distill", help="Distill the best model into compact students.")
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--model", help="Scoring bundle (default: <artifacts>/best_xgb.joblib).")
+    p.set_defaults(func=cmd_distill)
+
+    p = subparsers.add_parser("importance", help="Permutation and group-ablation importance.")
+    p.add_argument("--train", default=config.TRAIN_PATH)
+    p.add_argument("--test", default=config.TEST_PATH)
+    p.add_argument("--model", help="Scoring bundle (default: <artifacts>/best_xgb.joblib).")
+    p.add_argument("--input", help="Cleaned held-out CSV with churn_flag; also ranks original features.")
+    p.add_argument("--n-repeats", type=int, default=5)
+    p.add_argument("--n-jobs", type=int, default=-1)
+    p.add_argument("--top", type=int, default=20)
+    p.set_defaults(func=cmd_importance)
+
+    p = subparsers.add_parser("drift", help="Check scoring data for drift against training.")
+    p.add_argument("--input", required=True, help="Cleaned CSV being scored.")
+    p.add_argument("--chunksize", type=int, default=5000)
+    p.set_defaults(func=cmd_drift)
+
+    p = subparsers.add_parser(
+        "backtest", help="Rolling-origin backtest over snapshot dates.",
+        description="Trains on the couriers known at each snapshot date and scores the couriers "
+                    "first seen before the next one. Labels are the final churn_flag observed after "
+                    "extraction, so each fold measures ranking of a new-courier cohort by eventual "
+                    "churn, not month-over-month performance.")
+    p.add_argument("--input", default=config.CLEANED_DATA_PATH)
+    p.add_argument("--periods", type=int, default=12, help="Number of folds.")
+    p.add_argument("--freq", default="MS", help="Snapshot frequency (pandas offset alias).")
+    p.add_argument("--cache-dir", default=".backtest_cache")
+    p.add_argument("--n-jobs", type=int, default=-1)
+    p.set_defaults(func=cmd_backtest)
+
+    return parser
+
+
+def main(argv: list = None) -> None:
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,61 @@
+"""
+Shared constants: feature lists, default file locations and tuned hyperparameters.
+"""
+
+from datetime import datetime
+
+# Default stage inputs/outputs
+RAW_DATA_PATH = "churn_w_features.xlsx"
+FIXED_DATA_PATH = "churn_w_features_fixed.xlsx"
+CLEANED_DATA_PATH = "churn_w_features_cleaned.csv"
+PLS_DATA_PATH = "churn_w_features_PLS.csv"
+TRAIN_PATH = "train_churn_PLS.csv"
+TEST_PATH = "test_churn_PLS.csv"
+ARTIFACTS_DIR = "artifacts"
+
+# Reference date account_age_days is measured against
+REFERENCE_DATE = datetime(2025, 3, 11)
+
+# Irrelevant or deprecated columns dropped at cleaning time
+DEPRECATED_COLUMNS = [
+    "churn_days", "days_since_last_order",
+    "life_time_days_cnt", "life_time_order_cnt"
+]
+
+# Features where -1e6 / 1e6 are placeholders for missing values
+PLACEHOLDER_COLUMNS = [
+    "max_order_cpo_14d", "max_order_cpo_30d", "max_order_cpo_3d", "max_order_cpo_7d",
+    "min_order_cpo_14d", "min_order_cpo_30d", "min_order_cpo_3d", "min_order_cpo_7d"
+]
+
+# Numeric features fed into the scaler and PLS
+NUMERIC_FEATURES = [
+    "active_days_14d", "active_days_30d", "active_days_3d", "active_days_7d",
+    "age",
+    "avg_order_cpo_14d", "avg_order_cpo_30d", "avg_order_cpo_3d", "avg_order_cpo_7d",
+    "avg_trip_distance_14d", "avg_trip_distance_30d", "avg_trip_distance_3d", "avg_trip_distance_7d",
+    "max_order_cpo_14d", "max_order_cpo_30d", "max_order_cpo_3d", "max_order_cpo_7d",
+    "min_order_cpo_14d", "min_order_cpo_30d", "min_order_cpo_3d", "min_order_cpo_7d",
+    "num_orders_14d", "num_orders_30d", "num_orders_3d", "num_orders_7d",
+    "num_orders_total",
+    "orders_friday", "orders_monday", "orders_saturday", "orders_sunday",
+    "orders_thursday", "orders_tuesday", "orders_wednesday",
+    "total_income_14d", "total_income_30d", "total_income_3d", "total_income_7d",
+    "weekend_orders_ratio"
+]
+
+CATEGORICAL_FEATURES = ["movement_type", "hiring_channel_name", "region_id"]
+ONE_HOT_FEATURES = ["movement_type", "hiring_channel_name"]
+
+# Models trained on standardized features
+SCALED_MODELS = ["Logistic Regression", "SVM"]
+
+# Best XGBoost hyperparameters found by Optuna
+BEST_XGB_PARAMS = {
+    "n_estimators": 53,
+    "learning_rate": 0.11486744748271062,
+    "max_depth": 15,
+    "use_label_encoder": False,
+    "eval_metric": "logloss",
+    "random_state": 42
+}
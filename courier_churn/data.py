@@ -0,0 +1,68 @@
+"""
+Data import and cleaning stages.
+"""
+
+import pandas as pd
+
+from courier_churn.config import DEPRECATED_COLUMNS, NUMERIC_FEATURES, PLACEHOLDER_COLUMNS
+
+
+def load_and_fix_dates(input_path: str, output_path: str) -> None:
+    """
+    Loads a dataset from an Excel file, converts the 'first_order_delivered' column
+    from Unix day counts to datetime format, and saves the updated dataset to a new Excel file.
+
+    Parameters:
+    ----------
+    input_path : str
+        Path to the original Excel file.
+    output_path : str
+        Path where the corrected Excel file will be saved.
+    """
+    # Step 1: Load the dataset from the Excel file
+    df = pd.read_excel(input_path)
+
+    # Step 2: Convert 'first_order_delivered' from Unix day format to datetime
+    df['first_order_delivered'] = pd.to_datetime(
+        df['first_order_delivered'], origin='1970-01-01', unit='D'
+    )
+
+    # Step 3: Print a preview of the converted dates
+    print(df[['first_order_delivered']].head())
+
+    # Step 4: Save the updated DataFrame to a new Excel file
+    df.to_excel(output_path, index=False)
+
+    print("DataFrame successfully loaded and corrected.")
+
+
+def load_and_clean_dataset(file_path: str) -> pd.DataFrame:
+    """
+    Loads the dataset, handles missing values and placeholder values,
+    and prepares the data for further analysis.
+
+    Parameters
+    ----------
+    file_path : str
+        Path to the Excel file.
+
+    Returns
+    -------
+    pd.DataFrame
+        Cleaned dataset.
+    """
+    df = pd.read_excel(file_path)
+
+    # Drop irrelevant or deprecated columns
+    df.drop(columns=DEPRECATED_COLUMNS, inplace=True, errors="ignore")
+
+    # Replace invalid values (-1e6, 1e6) with 0 in specified features
+    df[PLACEHOLDER_COLUMNS] = df[PLACEHOLDER_COLUMNS].replace({-1_000_000: 0, 1_000_000: 0})
+
+    # Fill missing numeric values with zero
+    df[NUMERIC_FEATURES] = df[NUMERIC_FEATURES].fillna(0)
+
+    # Fill missing values in categorical columns
+    df["hiring_channel_name"] = df["hiring_channel_name"].fillna("Unknown")
+
+    return df
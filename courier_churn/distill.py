@@ -0,0 +1,292 @@
+"""
+Distillation of the tuned XGBoost model (teacher) into compact student models
+trained on the teacher's soft probabilities, with fidelity, AUC, model size and
+per-row scoring latency reported side by side.
+"""
+
+import pickle
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import roc_auc_score
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from xgboost import XGBRegressor
+
+from courier_churn.features import compile_pls
+from courier_churn.student import CompiledLogisticStudent, student_design_matrix
+
+
+def select_student_features(X: pd.DataFrame) -> list:
+    """
+    Selects the dense student features: the PLS components plus the one-hot
+    encoded categorical columns. region_id is added separately by each student
+    (one-hot for the logistic student, as is for the tree student).
+
+    Parameters
+    ----------
+    X : pd.DataFrame
+        Encoded feature matrix (as used to train the teacher).
+
+    Returns
+    -------
+    list
+        Column names used by the student models.
+    """
+    prefixes = ("PLS_", "movement_type_", "hiring_channel_name_")
+    return [col for col in X.columns if col.startswith(prefixes)]
+
+
+def train_logistic_student(X: np.ndarray, teacher_proba: np.ndarray, C: float = 1.0):
+    """
+    Trains a logistic regression student on the teacher's soft probabilities.
+
+    Each row is duplicated as a positive and a negative example weighted by
+    the teacher probability p and 1 - p, which makes the weighted log-loss
+    equal to the cross-entropy against the soft targets.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Student design matrix (student_design_matrix) for the training set.
+    teacher_proba : np.ndarray
+        Teacher churn probabilities for the same rows.
+    C : float
+        Inverse regularization strength.
+
+    Returns
+    -------
+    Pipeline
+        Fitted StandardScaler + LogisticRegression pipeline.
+    """
+    X_values = np.asarray(X, dtype=np.float64)
+    X_soft = np.vstack([X_values, X_values])
+    y_soft = np.concatenate([np.ones(len(X_values)), np.zeros(len(X_values))])
+    weights = np.concatenate([teacher_proba, 1.0 - teacher_proba])
+
+    student = make_pipeline(StandardScaler(), LogisticRegression(C=C, max_iter=1000))
+    student.fit(X_soft, y_soft, logisticregression__sample_weight=weights)
+    return student
+
+
+def train_tree_student(X: np.ndarray, teacher_proba: np.ndarray,
+                       n_estimators: int = 100, max_depth: int = 3,
+                       learning_rate: float = 0.1) -> XGBRegressor:
+    """
+    Trains a shallow boosted-tree student regressing the teacher's soft
+    probabilities with a logistic objective.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Dense student features plus the label-encoded region_id.
+    teacher_proba : np.ndarray
+        Teacher churn probabilities for the same rows.
+    n_estimators, max_depth, learning_rate
+        Size of the student ensemble.
+
+    Returns
+    -------
+    XGBRegressor
+        Fitted student whose predict() returns churn probabilities.
+    """
+    student = XGBRegressor(n_estimators=n_estimators,
+                           max_depth=max_depth,
+                           learning_rate=learning_rate,
+                           objective="reg:logistic",
+                           random_state=42)
+    student.fit(np.asarray(X, dtype=np.float32), teacher_proba)
+    return student
+
+
+def compile_logistic_student(student, columns: list, feature_idx: list, region_idx: int,
+                             regions: np.ndarray) -> CompiledLogisticStudent:
+    """
+    Folds the scaler of a logistic student into its coefficients so that a
+    row can be scored with a single dot product and no sklearn overhead.
+
+    Parameters
+    ----------
+    student : Pipeline
+        Output of train_logistic_student, fitted on student_design_matrix.
+    columns, feature_idx, region_idx, regions
+        Layout the design matrix was built from.
+
+    Returns
+    -------
+    CompiledLogisticStudent
+        Numpy-only scorer reading rows in the teacher column layout.
+    """
+    scaler = student.named_steps["standardscaler"]
+    logreg = student.named_steps["logisticregression"]
+    coef = logreg.coef_.ravel() / scaler.scale_
+    bias = logreg.intercept_[0] - np.dot(coef, scaler.mean_)
+    return CompiledLogisticStudent(columns, feature_idx, region_idx, regions, coef, bias)
+
+
+def make_student_bundle(bundle: dict, student: CompiledLogisticStudent) -> dict:
+    """
+    Builds a scoring bundle for the compiled student from the teacher's bundle.
+
+    The scaler and PLS are folded into a CompiledPLS, so loading and scoring
+    the bundle needs numpy and pandas only.
+    """
+    return {
+        **bundle,
+        "model": student,
+        "scaler": None,
+        "pls": compile_pls(bundle["scaler"], bundle["pls"], bundle["numeric_features"])
+    }
+
+
+def model_size_bytes(model) -> int:
+    """Returns the size of the pickled model in bytes."""
+    return len(pickle.dumps(model))
+
+
+def per_row_latency_ms(predict_fn, rows: list) -> float:
+    """
+    Measures the median latency of scoring one row at a time.
+
+    Parameters
+    ----------
+    predict_fn : callable
+        Function scoring a single prepared row.
+    rows : list
+        Rows already in the input format expected by predict_fn.
+
+    Returns
+    -------
+    float
+        Median latency per row in milliseconds.
+    """
+    timings = []
+    for row in rows:
+        start = time.perf_counter()
+        predict_fn(row)
+        timings.append(time.perf_counter() - start)
+    return float(np.median(timings) * 1000)
+
+
+def evaluate_distillation(teacher_proba: np.ndarray, y_true: pd.Series,
+                          candidates: dict) -> pd.DataFrame:
+    """
+    Compares students against the teacher on a held-out set.
+
+    Parameters
+    ----------
+    teacher_proba : np.ndarray
+        Teacher churn probabilities on the held-out set.
+    y_true : pd.Series
+        True churn labels of the held-out set.
+    candidates : dict
+        Name -> (probabilities, size in bytes, latency in ms per row).
+
+    Returns
+    -------
+    pd.DataFrame
+        Fidelity, AUC, AUC loss, size and latency for every candidate.
+    """
+    teacher_auc = roc_auc_score(y_true, teacher_proba)
+    teacher_label = teacher_proba >= 0.5
+
+    rows = []
+    for name, (proba, size_bytes, latency_ms) in candidates.items():
+        auc_value = roc_auc_score(y_true, proba)
+        rows.append({
+            "Model": name,
+            "Fidelity (label agreement)": np.mean((proba >= 0.5) == teacher_label),
+            "Mean |p - p_teacher|": np.mean(np.abs(proba - teacher_proba)),
+            "AUC-ROC": auc_value,
+            "AUC loss": teacher_auc - auc_value,
+            "Size (KB)": size_bytes / 1024,
+            "Latency (ms/row)": latency_ms
+        })
+    return pd.DataFrame(rows).round(4)
+
+
+def distill(teacher, X_train: pd.DataFrame, X_test: pd.DataFrame, y_test: pd.Series,
+            n_latency_rows: int = 200) -> tuple:
+    """
+    Trains both students from the teacher and compares all of them on the test set.
+
+    Parameters
+    ----------
+    teacher : XGBClassifier
+        Fitted teacher model.
+    X_train, X_test : pd.DataFrame
+        Encoded feature matrices the teacher was trained/evaluated on.
+    y_test : pd.Series
+        True churn labels of the test set.
+    n_latency_rows : int
+        Number of single-row calls timed per model.
+
+    Returns
+    -------
+    tuple
+        (df_distillation, students) where students holds the fitted students,
+        the compiled logistic scorer and the dense student feature list.
+    """
+    # Teacher soft probabilities on train (for training) and test (for fidelity)
+    teacher_train_proba = teacher.predict_proba(X_train)[:, 1]
+    teacher_test_proba = teacher.predict_proba(X_test)[:, 1]
+
+    # Every candidate reads rows in the teacher column layout
+    columns = X_train.columns.tolist()
+    X_train_values = X_train.to_numpy(dtype=np.float64)
+    X_test_values = X_test.to_numpy(dtype=np.float64)
+
+    student_features = select_student_features(X_train)
+    feature_idx = [columns.index(col) for col in student_features]
+    region_idx = columns.index("region_id")
+    regions = np.sort(np.unique(X_train_values[:, region_idx]))
+    tree_idx = feature_idx + [region_idx]
+
+    # Train the students
+    logistic_student = train_logistic_student(
+        student_design_matrix(X_train_values, feature_idx, region_idx, regions), teacher_train_proba)
+    tree_student = train_tree_student(X_train_values[:, tree_idx], teacher_train_proba)
+    compiled_student = compile_logistic_student(logistic_student, columns, feature_idx,
+                                                region_idx, regions)
+
+    # Time every candidate on the same input: a prepared float32 numpy row in
+    # the teacher layout, scored through each library's lightest single-row path
+    rows = [X_test_values[i:i + 1].astype(np.float32)
+            for i in range(min(n_latency_rows, len(X_test_values)))]
+    teacher_booster = teacher.get_booster()
+    tree_booster = tree_student.get_booster()
+
+    candidates = {
+        "Teacher: XGBoost (depth 15)": (
+            teacher_test_proba,
+            model_size_bytes(teacher),
+            per_row_latency_ms(lambda row: teacher_booster.inplace_predict(row), rows)
+        ),
+        "Student: shallow XGBoost (depth 3)": (
+            tree_student.predict(X_test_values[:, tree_idx].astype(np.float32)),
+            model_size_bytes(tree_student),
+            per_row_latency_ms(lambda row: tree_booster.inplace_predict(row[:, tree_idx]), rows)
+        ),
+        "Student: logistic (sklearn)": (
+            logistic_student.predict_proba(
+                student_design_matrix(X_test_values, feature_idx, region_idx, regions))[:, 1],
+            model_size_bytes(logistic_student),
+            per_row_latency_ms(lambda row: logistic_student.predict_proba(
+                student_design_matrix(row, feature_idx, region_idx, regions)), rows)
+        ),
+        "Student: logistic (compiled)": (
+            compiled_student.predict_proba(X_test_values)[:, 1],
+            model_size_bytes(compiled_student),
+            per_row_latency_ms(lambda row: compiled_student.predict_proba(row), rows)
+        )
+    }
+
+    students = {
+        "features": student_features,
+        "tree": tree_student,
+        "logistic": logistic_student,
+        "compiled": compiled_student
+    }
+    return evaluate_distillation(teacher_test_proba, y_test, candidates), students
@@ -0,0 +1,172 @@
+"""
+Streaming feature-drift monitor against the training reference.
+
+Fixed quantile bins and categorical levels are stored once at training time;
+incoming chunks only update bin counts, so memory stays bounded regardless
+of stream length.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+class DriftMonitor:
+    """
+    Incremental PSI / KS drift monitor over numeric features, PLS scores
+    and categorical levels. Nominal categoricals have no order, so their
+    distance column holds the total variation distance instead of a KS
+    statistic (which would depend on the order levels were first seen in).
+
+    Parameters
+    ----------
+    n_bins : int
+        Number of quantile bins per continuous feature.
+    psi_threshold : float
+        PSI above which a feature is flagged.
+    ks_threshold : float
+        Binned KS (or, for categoricals, total variation) distance above
+        which a feature is flagged.
+    """
+
+    def __init__(self, n_bins: int = 10, psi_threshold: float = 0.2, ks_threshold: float = 0.1):
+        self.n_bins = n_bins
+        self.psi_threshold = psi_threshold
+        self.ks_threshold = ks_threshold
+
+    def _continuous_matrix(self, df: pd.DataFrame) -> np.ndarray:
+        """Builds the [numeric features | PLS scores] matrix for a chunk."""
+        X_numeric = df[self.numeric_features].fillna(0)
+        X_scores = self.pls.transform(self.scaler.transform(X_numeric))
+        return np.hstack([X_numeric.to_numpy(dtype=np.float64), X_scores])
+
+    def _bin_counts(self, X: np.ndarray) -> np.ndarray:
+        """Counts rows per quantile bin for every continuous feature at once."""
+        # Bin index = number of interior edges <= value; padded edges are +inf
+        bins = (X[:, :, None] >= self.edges[None, :, :]).sum(axis=2)
+        n_features = X.shape[1]
+        flat = bins + np.arange(n_features) * self.n_bins
+        return np.bincount(flat.ravel(), minlength=n_features * self.n_bins).reshape(
+            n_features, self.n_bins)
+
+    def _level_codes(self, df: pd.DataFrame, col: str) -> np.ndarray:
+        """Maps categorical values to level indices; unseen levels go to the last slot."""
+        levels = self.levels[col]
+        codes = pd.Categorical(df[col], categories=levels).codes.astype(np.int64)
+        codes[codes < 0] = len(levels)
+        return codes
+
+    def fit(self, df: pd.DataFrame, numeric_features: list, scaler, pls,
+            categorical_features: list) -> "DriftMonitor":
+        """
+        Stores the reference distribution of the training data.
+
+        Parameters
+        ----------
+        df : pd.DataFrame
+            Cleaned training data the scaler and PLS were fitted on.
+        numeric_features : list
+            Numeric features fed into the scaler and PLS.
+        scaler : StandardScaler
+            Fitted scaler.
+        pls : PLSRegression
+            Fitted PLS model.
+        categorical_features : list
+            Categorical columns to monitor by level frequency.
+        """
+        self.numeric_features = list(numeric_features)
+        self.scaler = scaler
+        self.pls = pls
+        self.categorical_features = list(categorical_features)
+        self.continuous_names = self.numeric_features + [
+            f"PLS_{i + 1}" for i in range(pls.x_weights_.shape[1])
+        ]
+
+        X = self._continuous_matrix(df)
+        quantiles = np.linspace(0, 1, self.n_bins + 1)[1:-1]
+        self.edges = np.full((X.shape[1], self.n_bins - 1), np.inf)
+        for j in range(X.shape[1]):
+            # Drop repeated edges of zero-heavy features; unused bins stay empty
+            unique_edges = np.unique(np.quantile(X[:, j], quantiles))
+            self.edges[j, :len(unique_edges)] = unique_edges
+        self.ref_continuous = self._bin_counts(X) / len(X)
+
+        self.levels = {}
+        self.ref_categorical = {}
+        for col in self.categorical_features:
+            self.levels[col] = pd.Index(df[col].dropna().unique())
+            counts = np.bincount(self._level_codes(df, col), minlength=len(self.levels[col]) + 1)
+            self.ref_categorical[col] = counts / len(df)
+
+        self.reset()
+        return self
+
+    def reset(self) -> None:
+        """Clears the accumulated counts of the monitored stream."""
+        self.n_rows = 0
+        self.cur_continuous = np.zeros_like(self.ref_continuous, dtype=np.int64)
+        self.cur_categorical = {
+            col: np.zeros(len(ref), dtype=np.int64) for col, ref in self.ref_categorical.items()
+        }
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """
+        Adds a scoring chunk to the running counts.
+
+        Parameters
+        ----------
+        chunk : pd.DataFrame
+            Batch of cleaned couriers being scored.
+        """
+        self.n_rows += len(chunk)
+        self.cur_continuous += self._bin_counts(self._continuous_matrix(chunk))
+        for col in self.categorical_features:
+            self.cur_categorical[col] += np.bincount(
+                self._level_codes(chunk, col), minlength=len(self.cur_categorical[col]))
+
+    @staticmethod
+    def _psi_ks(ref: np.ndarray, cur: np.ndarray, eps: float = 1e-6) -> tuple:
+        """Computes PSI and binned KS distance row-wise for (features, bins) arrays."""
+        ref_p = np.clip(ref, eps, None)
+        cur_p = np.clip(cur, eps, None)
+        psi = ((cur_p - ref_p) * np.log(cur_p / ref_p)).sum(axis=-1)
+        ks = np.abs(np.cumsum(cur, axis=-1) - np.cumsum(ref, axis=-1)).max(axis=-1)
+        return psi, ks
+
+    def report(self) -> pd.DataFrame:
+        """
+        Computes drift statistics for every monitored feature.
+
+        Returns
+        -------
+        pd.DataFrame
+            One row per feature with PSI, KS (total variation distance for
+            categoricals) and an alert flag.
+        """
+        if self.n_rows == 0:
+            raise ValueError("No scoring data has been passed to update() yet.")
+
+        psi, ks = self._psi_ks(self.ref_continuous, self.cur_continuous / self.n_rows)
+        kinds = ["numeric"] * len(self.numeric_features) + ["pls"] * (
+            len(self.continuous_names) - len(self.numeric_features))
+        frames = [pd.DataFrame({
+            "feature": self.continuous_names, "kind": kinds, "psi": psi, "ks": ks
+        })]
+
+        for col in self.categorical_features:
+            ref, cur = self.ref_categorical[col], self.cur_categorical[col] / self.n_rows
+            cat_psi, _ = self._psi_ks(ref, cur)
+            # Total variation distance does not depend on the order of the levels
+            cat_tvd = 0.5 * np.abs(cur - ref).sum()
+            frames.append(pd.DataFrame({
+                "feature": [col], "kind": ["categorical"], "psi": [cat_psi], "ks": [cat_tvd]
+            }))
+
+        result = pd.concat(frames, ignore_index=True)
+        result["n_rows"] = self.n_rows
+        result["alert"] = (result["psi"] > self.psi_threshold) | (result["ks"] > self.ks_threshold)
+        return result
+
+    def alerts(self) -> pd.DataFrame:
+        """Returns only the features currently flagged as drifting."""
+        result = self.report()
+        return result[result["alert"]].sort_values("psi", ascending=False)
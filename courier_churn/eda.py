@@ -0,0 +1,126 @@
+"""
+Exploratory data analysis plots.
+"""
+
+import math
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+
+from courier_churn.config import CATEGORICAL_FEATURES, NUMERIC_FEATURES
+
+
+def explore_data(df: pd.DataFrame) -> None:
+    """
+    Performs exploratory data analysis (EDA) on the dataset,
+    including basic stats, distribution plots, and correlation analysis.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input cleaned dataset.
+    """
+    print("Dataset Overview:")
+    print(df.info())
+
+    print("\nMissing Values:")
+    print(df.isnull().sum())
+
+    # Churn distribution
+    plt.figure(figsize=(6, 4))
+    sns.countplot(x=df["churn_flag"], palette="Set2")
+    plt.title("Churn Flag Distribution (0 = Active, 1 = Churn)")
+    plt.show()
+
+    # Categorical feature distribution by churn
+    for col in CATEGORICAL_FEATURES:
+        plt.figure(figsize=(8, 4))
+        sns.countplot(y=df[col], hue=df["churn_flag"], palette="Set2")
+        plt.title(f"Distribution of {col} by Churn")
+        plt.show()
+
+    # Summary statistics
+    print("\nSummary Statistics of Numerical Features:")
+    print(df[NUMERIC_FEATURES].describe())
+
+    # Histograms
+    df[NUMERIC_FEATURES].hist(figsize=(16, 10), bins=30)
+    plt.suptitle("Distribution of Numerical Features", fontsize=16)
+    plt.show()
+
+    # Correlation heatmap
+    plt.figure(figsize=(22, 16))
+    sns.heatmap(
+        df[NUMERIC_FEATURES + ["churn_flag"]].corr(),
+        annot=True, cmap="coolwarm", fmt=".2f", linewidths=0.5
+    )
+    plt.title("Feature Correlation Matrix", fontsize=16)
+    plt.xticks(rotation=45, ha='right')
+    plt.yticks(rotation=0)
+    plt.show()
+
+    # Time-related feature distribution by churn
+    time_features = ["most_active_weekday", "least_active_weekday"]
+    for col in time_features:
+        plt.figure(figsize=(8, 4))
+        sns.boxplot(x=df["churn_flag"], y=df[col], palette="Set2")
+        plt.title(f"{col} vs Churn")
+        plt.show()
+
+    print("EDA completed successfully.")
+
+
+def plot_feature_distributions(df: pd.DataFrame, output_path: str, n_cols: int = 4) -> None:
+    """
+    Generate KDE plots for each numerical feature (with values > 0)
+    separated by churn label. Save the resulting multi-subplot figure
+    to a PNG file.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        The input cleaned dataset.
+    output_path : str
+        Path of the PNG file to write.
+    n_cols : int
+        Number of subplot columns.
+    """
+    # Create a subplot grid
+    n_rows = math.ceil(len(NUMERIC_FEATURES) / n_cols)
+    fig, axes = plt.subplots(n_rows, n_cols, figsize=(5 * n_cols, 4 * n_rows))
+    axes = axes.flatten()
+
+    used_axes = 0  # Counter for the number of axes actually used
+
+    # Generate KDE plots for each numeric feature (excluding non-positive values)
+    for feature in NUMERIC_FEATURES:
+        if df[feature].nunique() > 1:
+            ax = axes[used_axes]
+
+            for label, color in [(0, "blue"), (1, "red")]:
+                sns.kdeplot(
+                    data=df[(df["churn_flag"] == label) & (df[feature] > 0)],
+                    x=feature,
+                    fill=True,
+                    label=f"Churn = {label}",
+                    color=color,
+                    alpha=0.5,
+                    ax=ax,
+                    bw_adjust=0.5,
+                    cut=0,
+                    gridsize=1000
+                )
+
+            ax.set_title(feature)
+            ax.legend()
+            used_axes += 1
+
+    # Remove unused axes
+    for j in range(used_axes, len(axes)):
+        fig.delaxes(axes[j])
+
+    # Final layout and save to file
+    plt.tight_layout()
+    plt.savefig(output_path, dpi=300)
+    plt.show()
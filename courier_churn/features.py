@@ -0,0 +1,160 @@
+"""
+Model-ready feature encoding shared by training, tuning, scoring and backtesting.
+
+Only pandas and numpy are imported here so that the scoring path stays light.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+from courier_churn.config import ONE_HOT_FEATURES, REFERENCE_DATE
+
+
+class CompiledPLS:
+    """
+    Scaler + PLS projection folded into one affine map, X @ weights + offset.
+
+    Holds only numpy arrays, so a bundle using it unpickles without sklearn.
+    """
+
+    def __init__(self, weights: np.ndarray, offset: np.ndarray):
+        self.weights = weights
+        self.offset = offset
+
+    def transform(self, X) -> np.ndarray:
+        """Returns the PLS scores of raw (unscaled) numeric features."""
+        return np.asarray(X, dtype=np.float64) @ self.weights + self.offset
+
+
+def compile_pls(scaler, pls, numeric_features: list) -> CompiledPLS:
+    """
+    Folds a fitted StandardScaler and PLSRegression into a CompiledPLS.
+
+    Both transforms are affine, so evaluating them at the origin and at the
+    unit vectors recovers the combined map exactly.
+    """
+    n_features = len(numeric_features)
+    probe = pd.DataFrame(np.vstack([np.zeros(n_features), np.eye(n_features)]),
+                         columns=numeric_features)
+    scores = pls.transform(scaler.transform(probe))
+    return CompiledPLS(weights=scores[1:] - scores[0], offset=scores[0])
+
+
+def apply_pls(df: pd.DataFrame, scaler, pls, numeric_features: list) -> pd.DataFrame:
+    """
+    Replaces the numeric features with their PLS scores.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned dataset.
+    scaler : StandardScaler or None
+        Scaler fitted on the numeric features; None when pls is a
+        CompiledPLS that already includes the scaling.
+    pls : PLSRegression or CompiledPLS
+        PLS model fitted on the scaled numeric features.
+    numeric_features : list
+        Numeric features the scaler and PLS were fitted on.
+
+    Returns
+    -------
+    pd.DataFrame
+        PLS_* columns followed by every non-numeric column of df.
+    """
+    X_numeric = df[numeric_features] if scaler is None else scaler.transform(df[numeric_features])
+    X_scores = pls.transform(X_numeric)
+    pls_columns = [f"PLS_{i + 1}" for i in range(X_scores.shape[1])]
+    df_pls = pd.DataFrame(X_scores, columns=pls_columns, index=df.index)
+    return pd.concat([df_pls, df.drop(columns=numeric_features)], axis=1)
+
+
+def add_account_age(df: pd.DataFrame, reference_date: datetime = REFERENCE_DATE) -> pd.DataFrame:
+    """Replaces 'first_order_delivered' with the account age in days at reference_date."""
+    df = df.copy()
+    first_order = pd.to_datetime(df["first_order_delivered"])
+    df["account_age_days"] = (pd.Timestamp(reference_date) - first_order).dt.days
+    return df.drop(columns=["first_order_delivered"])
+
+
+def encode_regions(regions, classes: np.ndarray) -> np.ndarray:
+    """
+    Label-encodes region ids against the sorted training classes
+    (as LabelEncoder does); regions unseen at training time become -1.
+    """
+    regions = np.asarray(regions)
+    codes = np.clip(np.searchsorted(classes, regions), 0, len(classes) - 1)
+    return np.where(classes[codes] == regions, codes, -1)
+
+
+def prepare_features(df_train: pd.DataFrame, df_test: pd.DataFrame,
+                     reference_date: datetime = REFERENCE_DATE) -> tuple:
+    """
+    Builds model-ready train and test matrices from the PLS datasets:
+    account age, one-hot categoricals aligned to train, label-encoded region_id.
+
+    Returns
+    -------
+    tuple
+        (X_train, y_train, X_test, y_test, encoding) where encoding holds
+        what is needed to encode new data the same way.
+    """
+    # Convert date columns to datetime and compute account age
+    df_train = add_account_age(df_train, reference_date)
+    df_test = add_account_age(df_test, reference_date)
+
+    # One-hot encode categorical features
+    df_train = pd.get_dummies(df_train, columns=ONE_HOT_FEATURES, drop_first=True)
+    df_test = pd.get_dummies(df_test, columns=ONE_HOT_FEATURES)
+
+    # Align test set columns with train set (drops the train baseline levels)
+    df_test = df_test.reindex(columns=df_train.columns, fill_value=0)
+
+    # Label encode region_id
+    region_classes = np.sort(df_train["region_id"].unique())
+    df_train["region_id"] = encode_regions(df_train["region_id"], region_classes)
+    df_test["region_id"] = encode_regions(df_test["region_id"], region_classes)
+
+    # Separate features and target
+    X_train = df_train.drop(columns=["churn_flag"])
+    y_train = df_train["churn_flag"]
+    X_test = df_test.drop(columns=["churn_flag"])
+    y_test = df_test["churn_flag"]
+
+    encoding = {"columns": X_train.columns.tolist(), "region_classes": region_classes}
+    return X_train, y_train, X_test, y_test, encoding
+
+
+def load_train_test(train_path: str, test_path: str,
+                    reference_date: datetime = REFERENCE_DATE) -> tuple:
+    """Loads the train/test PLS datasets and runs prepare_features on them."""
+    return prepare_features(pd.read_csv(train_path), pd.read_csv(test_path), reference_date)
+
+
+def encode_for_scoring(df: pd.DataFrame, encoding: dict,
+                       reference_date: datetime = REFERENCE_DATE) -> pd.DataFrame:
+    """
+    Encodes new PLS-transformed rows exactly like the training matrix.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows in the PLS dataset format (courier_id and churn_flag are ignored).
+    encoding : dict
+        Encoding returned by prepare_features.
+    reference_date : datetime
+        Date account age is measured against.
+
+    Returns
+    -------
+    pd.DataFrame
+        Feature matrix with the training columns in the training order.
+    """
+    df = add_account_age(df.drop(columns=["courier_id", "churn_flag"], errors="ignore"),
+                         reference_date)
+    # Keep every level so that a chunk missing a category is not shifted by drop_first
+    df = pd.get_dummies(df, columns=ONE_HOT_FEATURES)
+    df = df.reindex(columns=encoding["columns"], fill_value=0)
+    df["region_id"] = encode_regions(df["region_id"], encoding["region_classes"])
+    return df
@@ -0,0 +1,193 @@
+"""
+Permutation and group-ablation importance for any fitted model.
+
+A single baseline prediction is computed once and reused by every task. Each
+worker copies the evaluation matrix into one preallocated buffer, perturbs the
+columns of a task in place, scores, and restores only those columns, so no
+DataFrame is copied per feature. Tasks (features x repeats) are spread across
+a joblib worker pool.
+
+Besides the model's own columns (PLS_*, encoded categoricals, ...), original
+numeric features can be permuted too: PLS scores are affine in the original
+inputs, so permuting an original feature is a rank-1 update of the PLS block.
+This only holds when the model consumes the PLS scores as they come out of
+apply_pls; the SCALED_MODELS baselines standardize them again and are not
+supported by the original-feature tasks.
+"""
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.metrics import roc_auc_score
+
+from courier_churn.config import ONE_HOT_FEATURES
+
+
+def default_groups(columns: list) -> dict:
+    """
+    Groups the one-hot columns of each categorical feature together;
+    every other column forms its own group.
+
+    Returns
+    -------
+    dict
+        Group name -> list of column names.
+    """
+    groups = {}
+    for col in columns:
+        prefix = next((name for name in ONE_HOT_FEATURES if col.startswith(f"{name}_")), None)
+        groups.setdefault(prefix or col, []).append(col)
+    return groups
+
+
+def original_feature_map(df: pd.DataFrame, scaler, pls, numeric_features: list,
+                         columns: list) -> dict:
+    """
+    Prepares the linear map from original numeric features to PLS scores.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned evaluation rows, aligned with the evaluation matrix.
+    scaler : StandardScaler or None
+        Fitted scaler; None when pls is a CompiledPLS that already includes
+        the scaling (student bundles).
+    pls : PLSRegression or CompiledPLS
+        Fitted PLS projection.
+    numeric_features : list
+        Numeric features the scaler and PLS were fitted on.
+    columns : list
+        Columns of the evaluation matrix.
+
+    Returns
+    -------
+    dict
+        Original features as fed into pls.transform, the (n_features,
+        n_components) effect of a unit change of each of them on the PLS
+        scores, the feature names and the positions of the PLS_* columns in
+        the evaluation matrix.
+    """
+    if scaler is None:
+        # CompiledPLS maps raw features directly: X @ weights + offset
+        inputs = df[numeric_features].to_numpy(dtype=np.float64)
+        effect = pls.weights
+    else:
+        n_features = len(numeric_features)
+        inputs = scaler.transform(df[numeric_features])
+        effect = pls.transform(np.eye(n_features)) - pls.transform(np.zeros((1, n_features)))
+    pls_columns = [f"PLS_{i + 1}" for i in range(effect.shape[1])]
+    return {
+        "inputs": inputs,
+        "effect": effect,
+        "names": list(numeric_features),
+        "pls_idx": [columns.index(col) for col in pls_columns]
+    }
+
+
+def compute_baseline(model, X: pd.DataFrame, y: pd.Series) -> dict:
+    """Computes the baseline churn probabilities and AUC once."""
+    proba = model.predict_proba(X)[:, 1]
+    return {"proba": proba, "auc": roc_auc_score(y, proba)}
+
+
+def _run_tasks(model, X_values: np.ndarray, columns: list, y: np.ndarray, tasks: list,
+               base_auc: float, fill_values: np.ndarray, original: dict) -> list:
+    """Evaluates a batch of tasks on one worker-local buffer."""
+    buffer = X_values.copy()
+    frame = pd.DataFrame(buffer, columns=columns, copy=False)  # view over buffer
+    n_rows = len(buffer)
+
+    results = []
+    for method, name, idx, repeat, seed in tasks:
+        if method == "permutation":
+            perm = np.random.default_rng(seed).permutation(n_rows)
+            buffer[:, idx] = X_values[perm[:, None], idx]
+        elif method == "ablation":
+            buffer[:, idx] = fill_values[idx]
+        else:  # original feature propagated through the PLS map
+            perm = np.random.default_rng(seed).permutation(n_rows)
+            j = original["names"].index(name)
+            delta = original["inputs"][perm, j] - original["inputs"][:, j]
+            buffer[:, idx] += np.outer(delta, original["effect"][j])
+
+        auc_value = roc_auc_score(y, model.predict_proba(frame)[:, 1])
+        results.append({"feature": name, "method": method, "repeat": repeat,
+                        "auc_drop": base_auc - auc_value})
+
+        # Restore only the perturbed columns
+        buffer[:, idx] = X_values[:, idx]
+    return results
+
+
+def compute_importance(model, X: pd.DataFrame, y: pd.Series, groups: dict = None,
+                       n_repeats: int = 5, ablation: bool = True, original: dict = None,
+                       baseline: dict = None, n_jobs: int = -1, backend: str = "loky",
+                       random_state: int = 42) -> pd.DataFrame:
+    """
+    Computes permutation and group-ablation importance as the drop in AUC-ROC.
+
+    Parameters
+    ----------
+    model : estimator
+        Fitted model with predict_proba (e.g. best_xgb or any model in models).
+    X : pd.DataFrame
+        Evaluation matrix in the model's input format.
+    y : pd.Series
+        True churn labels.
+    groups : dict
+        Group name -> columns permuted/ablated together (default_groups if None).
+    n_repeats : int
+        Permutations per group; repeat r uses the same row permutation for
+        every group.
+    ablation : bool
+        Also replace each group by its column means (one pass, no repeats).
+    original : dict
+        Output of original_feature_map to also rank original numeric features.
+        X must then hold the PLS scores as produced by apply_pls, so this is
+        not valid for SCALED_MODELS evaluated on re-standardized inputs.
+    baseline : dict
+        Cached output of compute_baseline; computed here if None.
+    n_jobs : int
+        Number of workers (-1 uses all cores).
+    backend : str
+        joblib backend; "threading" avoids pickling the model for libraries
+        that release the GIL while predicting.
+    random_state : int
+        Seed of the row permutations.
+
+    Returns
+    -------
+    pd.DataFrame
+        Mean and standard deviation of the AUC drop per feature and method.
+    """
+    columns = X.columns.tolist()
+    groups = groups or default_groups(columns)
+    baseline = baseline or compute_baseline(model, X, y)
+    X_values = X.to_numpy(dtype=np.float64)
+    fill_values = X_values.mean(axis=0)
+
+    tasks = []
+    for name, cols in groups.items():
+        idx = [columns.index(col) for col in cols]
+        tasks += [("permutation", name, idx, r, random_state + r) for r in range(n_repeats)]
+        if ablation:
+            tasks.append(("ablation", name, idx, 0, None))
+    if original is not None:
+        tasks += [("original", name, original["pls_idx"], r, random_state + r)
+                  for name in original["names"] for r in range(n_repeats)]
+
+    # One batch per worker so that each worker allocates a single buffer
+    n_batches = min(effective_n_jobs(n_jobs), len(tasks))
+    batches = Parallel(n_jobs=n_jobs, backend=backend)(
+        delayed(_run_tasks)(model, X_values, columns, np.asarray(y), tasks[i::n_batches],
+                            baseline["auc"], fill_values, original)
+        for i in range(n_batches)
+    )
+
+    df = pd.DataFrame([row for batch in batches for row in batch])
+    summary = (df.groupby(["method", "feature"])["auc_drop"]
+                 .agg(importance_mean="mean", importance_std="std")
+                 .reset_index()
+                 .sort_values(["method", "importance_mean"], ascending=[True, False]))
+    summary["baseline_auc"] = baseline["auc"]
+    return summary.reset_index(drop=True)
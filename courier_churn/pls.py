@@ -0,0 +1,108 @@
+"""
+Standardization + PLS stage and the train/test split.
+"""
+
+import pandas as pd
+from sklearn.cross_decomposition import PLSRegression
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+
+from courier_churn.config import NUMERIC_FEATURES
+from courier_churn.features import apply_pls
+
+
+def fit_pls(df: pd.DataFrame, numeric_features: list = NUMERIC_FEATURES,
+            n_components: int = 15) -> tuple:
+    """
+    Standardizes the numeric features and replaces them with PLS components
+    fitted against churn_flag.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Cleaned dataset.
+    numeric_features : list
+        Numeric features to compress.
+    n_components : int
+        Maximum number of PLS components.
+
+    Returns
+    -------
+    tuple
+        (df_final, scaler, pls): PLS_* columns plus all non-numeric columns,
+        and the fitted StandardScaler and PLSRegression.
+    """
+    # Standardize numeric features before applying PLS
+    scaler = StandardScaler()
+    df_scaled = scaler.fit_transform(df[numeric_features])
+
+    # Fit PLS regression model on numeric features
+    pls = PLSRegression(n_components=min(len(numeric_features), n_components))
+    pls.fit(df_scaled, df["churn_flag"])
+
+    # Combine PLS-transformed numeric data with non-numeric data
+    df_final = apply_pls(df, scaler, pls, numeric_features)
+    return df_final, scaler, pls
+
+
+def split_train_test(df_final: pd.DataFrame, train_path: str, test_path: str,
+                     test_size: float = 0.2) -> None:
+    """
+    Splits the PLS dataset into stratified train and test sets and saves both.
+
+    Parameters
+    ----------
+    df_final : pd.DataFrame
+        Output of fit_pls.
+    train_path, test_path : str
+        Output CSV paths.
+    test_size : float
+        Share of rows held out for testing.
+    """
+    # Define feature matrix (X) and target vector (y)
+    X = df_final.drop(columns=["courier_id", "churn_flag"])  # Exclude ID and target
+    y = df_final["churn_flag"]  # Target variable
+
+    # Split the dataset into training and testing sets using stratification
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=test_size, random_state=42, stratify=y
+    )
+
+    # Combine features and target for each set and save to file
+    train_df = X_train.copy()
+    train_df["churn_flag"] = y_train
+    train_df.to_csv(train_path, index=False)
+
+    test_df = X_test.copy()
+    test_df["churn_flag"] = y_test
+    test_df.to_csv(test_path, index=False)
+
+    # Print confirmation and summary
+    print("✅ Train-test split completed successfully.")
+    print(f"Train set size: {X_train.shape[0]} rows")
+    print(f"Test set size: {X_test.shape[0]} rows")
+
+
+def pls_feature_weights(pls: PLSRegression, numeric_features: list = NUMERIC_FEATURES) -> pd.DataFrame:
+    """Returns the original feature weights across all PLS components."""
+    return pd.DataFrame(
+        pls.x_weights_,  # shape: (n_original_features, n_components)
+        index=numeric_features,
+        columns=[f"PLS_{i + 1}" for i in range(pls.x_weights_.shape[1])]
+    )
+
+
+def top_pls_contributors(pls: PLSRegression, component: str = "PLS_12", top_n: int = 20,
+                         numeric_features: list = NUMERIC_FEATURES) -> pd.Series:
+    """
+    Identifies the original features contributing most to a PLS component
+    based on the absolute weight magnitude.
+
+    Returns
+    -------
+    pd.Series
+        Signed weights of the top_n features, sorted by absolute weight.
+    """
+    contributions = pls_feature_weights(pls, numeric_features)[component]
+    top_features = contributions.abs().sort_values(ascending=False).head(top_n)
+    return contributions[top_features.index]
@@ -0,0 +1,155 @@
+"""
+Streaming top-K at-risk courier ranking per group (region, hiring channel).
+
+Scored chunks never get materialized as a whole: every grouping keeps at most
+K candidates per group, chunks are reduced to their own per-group top K with a
+single vectorized sort, and partial rankings from parallel workers are merged
+the same way.
+"""
+
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+from courier_churn.config import REFERENCE_DATE
+from courier_churn.score import load_scoring_bundle, score_frame
+
+
+def _select_top_k(keys: np.ndarray, ids: np.ndarray, scores: np.ndarray, k: int) -> tuple:
+    """Keeps the k highest scores of every key (ties broken by id)."""
+    # Sort on integer key codes so that keys of mixed types are never compared
+    codes = pd.factorize(keys)[0]
+    order = np.lexsort((ids, -scores, codes))
+    keys, ids, scores, codes = keys[order], ids[order], scores[order], codes[order]
+
+    # Position of every row within its key block
+    starts = np.flatnonzero(np.r_[True, codes[1:] != codes[:-1]])
+    block_start = np.repeat(starts, np.diff(np.r_[starts, len(keys)]))
+    keep = np.arange(len(keys)) - block_start < k
+    return keys[keep], ids[keep], scores[keep]
+
+
+class TopKRanker:
+    """
+    Bounded per-group top-K buffers for several groupings at once.
+
+    Parameters
+    ----------
+    k : int
+        Number of couriers kept per group.
+    by : list
+        Grouping columns; each column gets its own ranking. Missing group
+        values are ranked together under MISSING_GROUP.
+    """
+
+    MISSING_GROUP = "Unknown"
+
+    def __init__(self, k: int = 100, by: list = ("region_id", "hiring_channel_name")):
+        self.k = k
+        self.by = list(by)
+        self.buffers = {col: None for col in self.by}
+
+    def _push(self, col: str, keys: np.ndarray, ids: np.ndarray, scores: np.ndarray) -> None:
+        """Merges candidates into the buffer of one grouping."""
+        if self.buffers[col] is not None:
+            buffer_keys, buffer_ids, buffer_scores = self.buffers[col]
+            keys = np.concatenate([buffer_keys, keys])
+            ids = np.concatenate([buffer_ids, ids])
+            scores = np.concatenate([buffer_scores, scores])
+        self.buffers[col] = _select_top_k(keys.astype(object), ids, scores, self.k)
+
+    def update(self, groups: pd.DataFrame, ids, scores) -> "TopKRanker":
+        """
+        Adds a scored chunk.
+
+        Parameters
+        ----------
+        groups : pd.DataFrame
+            Grouping columns of the chunk.
+        ids : array-like
+            courier_id of every row.
+        scores : array-like
+            Churn probability of every row.
+        """
+        ids, scores = np.asarray(ids), np.asarray(scores, dtype=np.float64)
+        for col in self.by:
+            keys = groups[col].astype(object).where(groups[col].notna(), self.MISSING_GROUP)
+            self._push(col, keys.to_numpy(dtype=object), ids, scores)
+        return self
+
+    def merge(self, other: "TopKRanker") -> "TopKRanker":
+        """Merges the partial ranking of another worker into this one."""
+        for col in self.by:
+            if other.buffers[col] is not None:
+                self._push(col, *other.buffers[col])
+        return self
+
+    def result(self) -> pd.DataFrame:
+        """
+        Returns the top-K lists.
+
+        Returns
+        -------
+        pd.DataFrame
+            group_by, group, rank, courier_id and churn_proba, highest risk first.
+        """
+        frames = []
+        for col, buffer in self.buffers.items():
+            if buffer is None:
+                continue
+            keys, ids, scores = buffer
+            df = pd.DataFrame({"group_by": col, "group": keys, "courier_id": ids, "churn_proba": scores})
+            df.insert(2, "rank", df.groupby("group", sort=False).cumcount() + 1)
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True)
+
+
+def _rank_chunk(chunk: pd.DataFrame, bundle: dict, k: int, by: list,
+                reference_date: datetime) -> TopKRanker:
+    """Scores one chunk and reduces it to its per-group top K; runs in a worker."""
+    scores = score_frame(chunk, bundle, reference_date)
+    return TopKRanker(k, by).update(chunk, scores["courier_id"], scores["churn_proba"])
+
+
+def rank_file(input_path: str, bundle_path: str, k: int = 100,
+              by: list = ("region_id", "hiring_channel_name"),
+              reference_date: datetime = REFERENCE_DATE, chunksize: int = 50_000,
+              n_jobs: int = -1) -> pd.DataFrame:
+    """
+    Scores a cleaned CSV in parallel chunks and returns the top-K couriers per group.
+
+    Parameters
+    ----------
+    input_path : str
+        Cleaned CSV to score.
+    bundle_path : str
+        Scoring bundle written by the train stage.
+    k : int
+        Number of couriers kept per group.
+    by : list
+        Grouping columns.
+    reference_date : datetime
+        Date account age is measured against.
+    chunksize : int
+        Rows per scoring chunk.
+    n_jobs : int
+        Number of worker processes (-1 uses all cores).
+
+    Returns
+    -------
+    pd.DataFrame
+        Output of TopKRanker.result.
+    """
+    # Loaded once per call so that a replaced bundle file is always picked up
+    bundle = load_scoring_bundle(bundle_path)
+    ranker = TopKRanker(k, by)
+    partials = Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(
+        delayed(_rank_chunk)(chunk, bundle, k, list(by), reference_date)
+        for chunk in pd.read_csv(input_path, chunksize=chunksize)
+    )
+    # Partial rankings are merged as they arrive, so only K rows per group stay alive
+    for partial in partials:
+        ranker.merge(partial)
+    return ranker.result()
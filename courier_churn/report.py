@@ -0,0 +1,89 @@
+"""
+Plots and tables for model evaluation and feature insight.
+"""
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import seaborn as sns
+from sklearn.metrics import confusion_matrix, roc_curve
+from sklearn.utils.multiclass import unique_labels
+
+
+def plot_roc_curves(roc_data: list, title: str = "ROC Curves for All Models") -> None:
+    """Plots ROC curves from (name, fpr, tpr, auc) tuples."""
+    plt.figure(figsize=(10, 8))
+    for name, fpr, tpr, roc_auc in roc_data:
+        plt.plot(fpr, tpr, label=f"{name} (AUC = {roc_auc:.3f})")
+    plt.plot([0, 1], [0, 1], linestyle="--", color="gray")
+    plt.xlabel("False Positive Rate")
+    plt.ylabel("True Positive Rate")
+    plt.title(title)
+    plt.legend()
+    plt.grid(True)
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_roc_curve(y_true: pd.Series, y_proba: np.ndarray, auc_score: float, name: str) -> None:
+    """Plots the ROC curve of a single model."""
+    fpr, tpr, _ = roc_curve(y_true, y_proba)
+    plot_roc_curves([(name, fpr, tpr, auc_score)], title=f"ROC Curve - {name}")
+
+
+def plot_metrics_table(df_metrics: pd.DataFrame, title: str) -> None:
+    """Renders a metrics DataFrame as a matplotlib table."""
+    plt.figure(figsize=(10, 0.5 * len(df_metrics) + 1))
+    ax = plt.gca()
+    ax.axis("off")
+    cell_text = df_metrics.apply(
+        lambda col: col.round(3) if pd.api.types.is_numeric_dtype(col) else col
+    ).values
+    table = plt.table(cellText=cell_text,
+                      colLabels=df_metrics.columns,
+                      cellLoc="center",
+                      loc="center")
+    table.auto_set_font_size(False)
+    table.set_fontsize(10)
+    table.scale(1.2, 1.5)
+    plt.title(title, fontsize=14)
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_confusion_matrix(y_true: pd.Series, y_pred: np.ndarray, name: str) -> None:
+    """Plots the normalized confusion matrix of a model."""
+    cm = confusion_matrix(y_true, y_pred, normalize="true")
+    plt.figure(figsize=(4, 3))
+    sns.heatmap(cm, annot=True, fmt=".2f", cmap="Blues", cbar=False,
+                xticklabels=unique_labels(y_true, y_pred),
+                yticklabels=unique_labels(y_true, y_pred))
+    plt.title(f"Normalized Confusion Matrix: {name}")
+    plt.xlabel("Predicted")
+    plt.ylabel("Actual")
+    plt.tight_layout()
+    plt.show()
+
+
+def plot_shap_pls(model, X_test: pd.DataFrame) -> None:
+    """
+    Compute and visualize SHAP values for PLS features of a tree model,
+    using TreeExplainer over the whole test set.
+    """
+    import shap
+
+    # Compute SHAP values for the entire test set
+    explainer = shap.TreeExplainer(model)
+    shap_values = np.asarray(explainer.shap_values(X_test))
+
+    # Select SHAP values corresponding only to the PLS features
+    pls_features = [col for col in X_test.columns if col.startswith("PLS_")]
+    pls_indices = [X_test.columns.get_loc(feature) for feature in pls_features]
+
+    # Plot SHAP summary beeswarm plot for PLS features
+    shap.summary_plot(
+        shap_values[:, pls_indices],
+        features=X_test[pls_features],
+        feature_names=pls_features,
+        show=True
+    )
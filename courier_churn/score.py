@@ -0,0 +1,72 @@
+"""
+Batch scoring of cleaned courier data with a trained scoring bundle.
+
+This is the latency-sensitive entry point: it imports only pandas, numpy and
+joblib up front. Model libraries are loaded when the bundle is unpickled.
+"""
+
+from datetime import datetime
+
+import joblib
+import pandas as pd
+
+from courier_churn.config import REFERENCE_DATE
+from courier_churn.features import apply_pls, encode_for_scoring
+
+
+def load_scoring_bundle(path: str) -> dict:
+    """
+    Loads a scoring bundle written by the train stage.
+
+    Returns
+    -------
+    dict
+        model, encoding, scaler (None for compiled bundles), pls and numeric_features.
+    """
+    return joblib.load(path)
+
+
+def score_frame(df: pd.DataFrame, bundle: dict,
+                reference_date: datetime = REFERENCE_DATE) -> pd.DataFrame:
+    """
+    Scores cleaned courier rows.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        Rows in the cleaned dataset format (output of the clean stage).
+    bundle : dict
+        Output of load_scoring_bundle.
+    reference_date : datetime
+        Date account age is measured against.
+
+    Returns
+    -------
+    pd.DataFrame
+        courier_id and churn probability of every row.
+    """
+    df_pls = apply_pls(df, bundle["scaler"], bundle["pls"], bundle["numeric_features"])
+    X = encode_for_scoring(df_pls, bundle["encoding"], reference_date)
+    return pd.DataFrame({
+        "courier_id": df["courier_id"].to_numpy(),
+        "churn_proba": bundle["model"].predict_proba(X)[:, 1]
+    })
+
+
+def score_file(input_path: str, output_path: str, bundle_path: str,
+               reference_date: datetime = REFERENCE_DATE, chunksize: int = 50_000) -> int:
+    """
+    Scores a cleaned CSV file chunk by chunk and writes churn probabilities.
+
+    Returns
+    -------
+    int
+        Number of scored rows.
+    """
+    bundle = load_scoring_bundle(bundle_path)
+    n_rows = 0
+    for i, chunk in enumerate(pd.read_csv(input_path, chunksize=chunksize)):
+        scores = score_frame(chunk, bundle, reference_date)
+        scores.to_csv(output_path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+        n_rows += len(scores)
+    return n_rows
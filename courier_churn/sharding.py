@@ -0,0 +1,165 @@
+"""
+Per-region sharded training and routed scoring.
+
+One model is trained per region_id (with a global fallback for small regions)
+in parallel worker processes; scoring batches are routed to the right shard and
+each shard is retrained independently on its own schedule.
+"""
+
+import warnings
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+
+
+def _fit_shard(make_model, X: pd.DataFrame, y: pd.Series):
+    """Fits a fresh model from the factory; runs inside a worker process."""
+    model = make_model()
+    model.fit(X, y)
+    return model
+
+
+class ShardedChurnModel:
+    """
+    Per-region churn models with a global fallback.
+
+    Parameters
+    ----------
+    make_model : callable
+        Picklable factory returning an unfitted classifier
+        (e.g. functools.partial(XGBClassifier, ...)).
+    region_col : str
+        Column holding the (encoded) region identifier.
+    min_shard_size : int
+        Regions with fewer training rows are scored by the global model.
+    retrain_every : timedelta
+        Default retraining interval of a shard.
+    """
+
+    GLOBAL = "global"
+
+    def __init__(self, make_model, region_col: str = "region_id",
+                 min_shard_size: int = 1000, retrain_every: timedelta = timedelta(days=7)):
+        self.make_model = make_model
+        self.region_col = region_col
+        self.min_shard_size = min_shard_size
+        self.retrain_every = retrain_every
+        self.shards = {}
+        self.trained_at = {}
+        self.schedule = {}
+
+    def _shard_keys(self, X: pd.DataFrame, y: pd.Series) -> list:
+        """Returns the regions large enough (and with both classes) to get their own model."""
+        stats = pd.DataFrame({"region": X[self.region_col].to_numpy(), "y": y.to_numpy()})
+        stats = stats.groupby("region")["y"].agg(["size", "nunique"])
+        eligible = stats[(stats["size"] >= self.min_shard_size) & (stats["nunique"] == 2)]
+        return eligible.index.tolist()
+
+    def _train(self, keys: list, X: pd.DataFrame, y: pd.Series, n_jobs: int) -> list:
+        """
+        Trains the given shards (and/or the global model) in parallel processes.
+
+        Regional keys that are no longer eligible on this data are dropped back
+        to the global fallback instead of being fitted on too few rows or on a
+        single class.
+
+        Returns
+        -------
+        list
+            Keys that were actually trained.
+        """
+        eligible = set(self._shard_keys(X, y))
+        dropped = [key for key in keys if key != self.GLOBAL and key not in eligible]
+        for key in dropped:
+            self.shards.pop(key, None)
+            self.trained_at.pop(key, None)
+        if dropped:
+            warnings.warn(f"Regions {dropped} are no longer eligible for their own shard "
+                          f"and are now scored by the global model.")
+
+        keys = [key for key in keys if key not in dropped]
+        regions = X[self.region_col].to_numpy()
+        jobs = []
+        for key in keys:
+            mask = np.ones(len(X), dtype=bool) if key == self.GLOBAL else regions == key
+            jobs.append(delayed(_fit_shard)(self.make_model, X[mask], y[mask]))
+
+        fitted = Parallel(n_jobs=n_jobs, backend="loky")(jobs)
+        now = datetime.now()
+        for key, model in zip(keys, fitted):
+            self.shards[key] = model
+            self.trained_at[key] = now
+            self.schedule.setdefault(key, self.retrain_every)
+        return keys
+
+    def fit(self, X: pd.DataFrame, y: pd.Series, n_jobs: int = -1) -> "ShardedChurnModel":
+        """
+        Trains the global fallback and every eligible regional shard.
+
+        Parameters
+        ----------
+        X : pd.DataFrame
+            Training features including the region column.
+        y : pd.Series
+            Churn labels.
+        n_jobs : int
+            Number of worker processes (-1 uses all cores).
+        """
+        self.shards, self.trained_at = {}, {}
+        self._train([self.GLOBAL] + self._shard_keys(X, y), X, y, n_jobs)
+        return self
+
+    def set_schedule(self, key, every: timedelta) -> None:
+        """Overrides the retraining interval of a single shard."""
+        self.schedule[key] = every
+
+    def due_shards(self, now: datetime = None) -> list:
+        """Returns the shards whose retraining interval has elapsed."""
+        now = now or datetime.now()
+        return [key for key, trained in self.trained_at.items()
+                if now - trained >= self.schedule[key]]
+
+    def retrain(self, X: pd.DataFrame, y: pd.Series, keys: list = None, n_jobs: int = -1) -> list:
+        """
+        Retrains only the given shards (by default the ones that are due plus
+        regions that have newly become eligible), leaving every other shard
+        untouched. Shards whose region is no longer eligible on X, y fall back
+        to the global model.
+
+        Returns
+        -------
+        list
+            Keys of the retrained shards.
+        """
+        if keys is None:
+            new_regions = [key for key in self._shard_keys(X, y) if key not in self.shards]
+            keys = self.due_shards() + new_regions
+        keys = list(keys)
+        return self._train(keys, X, y, n_jobs) if keys else []
+
+    def route(self, X: pd.DataFrame) -> pd.Series:
+        """Returns the shard key serving each row."""
+        regions = X[self.region_col]
+        return regions.where(regions.isin(list(self.shards)), self.GLOBAL)
+
+    def predict_proba(self, X: pd.DataFrame) -> np.ndarray:
+        """
+        Scores a batch by dispatching each region's rows to its shard.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n_rows, 2) with class probabilities.
+        """
+        proba = np.empty((len(X), 2))
+        keys = self.route(X).to_numpy()
+        for key in pd.unique(keys):
+            idx = np.flatnonzero(keys == key)
+            proba[idx] = self.shards[key].predict_proba(X.iloc[idx])
+        return proba
+
+    def predict(self, X: pd.DataFrame) -> np.ndarray:
+        """Predicts churn labels with a 0.5 threshold."""
+        return (self.predict_proba(X)[:, 1] >= 0.5).astype(int)
@@ -0,0 +1,67 @@
+"""
+Compiled logistic student for low-latency scoring.
+
+Only numpy and pandas are imported here so that a scoring bundle holding the
+student can be unpickled without sklearn or any boosting library.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def student_design_matrix(X: np.ndarray, feature_idx: list, region_idx: int,
+                          regions: np.ndarray) -> np.ndarray:
+    """
+    Builds the logistic student inputs from rows in the teacher column layout:
+    the selected dense columns followed by a one-hot encoded region_id.
+    Regions outside the training classes (including -1) get all zeros.
+    """
+    region_one_hot = X[:, [region_idx]] == regions[None, :]
+    return np.hstack([X[:, feature_idx], region_one_hot])
+
+
+class CompiledLogisticStudent:
+    """
+    Logistic student reduced to one dot product on the teacher's encoded columns.
+
+    Parameters
+    ----------
+    columns : list
+        Teacher column layout the student reads from.
+    feature_idx : list
+        Positions of the dense student features in that layout.
+    region_idx : int
+        Position of the label-encoded region_id.
+    regions : np.ndarray
+        Region codes with their own one-hot weight.
+    weights : np.ndarray
+        Weights of [dense features, region one-hot], scaler already folded in.
+    bias : float
+        Intercept, scaler already folded in.
+    """
+
+    def __init__(self, columns: list, feature_idx: list, region_idx: int,
+                 regions: np.ndarray, weights: np.ndarray, bias: float):
+        self.columns = list(columns)
+        self.feature_idx = list(feature_idx)
+        self.region_idx = region_idx
+        self.regions = np.asarray(regions)
+        n_features = len(self.feature_idx)
+        self.feature_weights = np.asarray(weights[:n_features])
+        self.region_weights = np.asarray(weights[n_features:])
+        self.bias = float(bias)
+
+    def decision_function(self, X) -> np.ndarray:
+        """Returns the logit of churn for rows in the teacher column layout."""
+        if isinstance(X, pd.DataFrame):
+            X = X[self.columns].to_numpy(dtype=np.float64)
+        region_pos = np.searchsorted(self.regions, X[:, self.region_idx])
+        region_pos = np.clip(region_pos, 0, len(self.regions) - 1)
+        known = self.regions[region_pos] == X[:, self.region_idx]
+        region_term = np.where(known, self.region_weights[region_pos], 0.0)
+        return X[:, self.feature_idx] @ self.feature_weights + region_term + self.bias
+
+    def predict_proba(self, X) -> np.ndarray:
+        """Returns class probabilities of shape (n_rows, 2)."""
+        proba = 1.0 / (1.0 + np.exp(-self.decision_function(X)))
+        return np.column_stack([1.0 - proba, proba])
@@ -0,0 +1,134 @@
+"""
+Training and evaluation of the baseline models and of the tuned XGBoost model.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+from sklearn.metrics import auc, classification_report, roc_auc_score, roc_curve
+from sklearn.preprocessing import StandardScaler
+
+from courier_churn.config import BEST_XGB_PARAMS, SCALED_MODELS
+
+
+def make_models() -> dict:
+    """
+    Builds the baseline models to compare. Boosting libraries are imported
+    here so that importing this module does not require them.
+
+    Returns
+    -------
+    dict
+        Model name -> unfitted estimator.
+    """
+    from catboost import CatBoostClassifier
+    from lightgbm import LGBMClassifier
+    from sklearn.ensemble import RandomForestClassifier
+    from sklearn.linear_model import LogisticRegression
+    from sklearn.svm import SVC
+    from sklearn.tree import DecisionTreeClassifier
+    from xgboost import XGBClassifier
+
+    return {
+        "Logistic Regression": LogisticRegression(max_iter=500),
+        "Decision Tree": DecisionTreeClassifier(random_state=42),
+        "Random Forest": RandomForestClassifier(n_estimators=100, random_state=42),
+        "XGBoost": XGBClassifier(use_label_encoder=False, eval_metric="logloss", random_state=42),
+        "LightGBM": LGBMClassifier(random_state=42),
+        "CatBoost": CatBoostClassifier(verbose=0, random_state=42),
+        "SVM": SVC(probability=True, random_state=42)
+    }
+
+
+def train_baselines(models: dict, X_train: pd.DataFrame, y_train: pd.Series,
+                    X_test: pd.DataFrame, y_test: pd.Series) -> tuple:
+    """
+    Trains every model and evaluates it on the test set. Scaling-sensitive
+    models are trained on standardized features.
+
+    Returns
+    -------
+    tuple
+        (df_results, roc_data, test_predictions): a metrics table sorted by
+        AUC-ROC, (name, fpr, tpr, auc) tuples for ROC plots and the test
+        label predictions of every model.
+    """
+    # Scale features for scaling-sensitive models
+    scaler = StandardScaler()
+    X_train_scaled = scaler.fit_transform(X_train)
+    X_test_scaled = scaler.transform(X_test)
+
+    results = []
+    roc_data = []
+    test_predictions = {}
+
+    # Train and evaluate each model
+    for name, model in models.items():
+        print(f"Training {name}...")
+        X_fit, X_eval = (X_train_scaled, X_test_scaled) if name in SCALED_MODELS else (X_train, X_test)
+
+        start = time.time()
+        model.fit(X_fit, y_train)
+        y_test_pred = model.predict(X_eval)
+        y_test_proba = model.predict_proba(X_eval)[:, 1]
+        training_time = time.time() - start
+
+        # Compute ROC curve
+        fpr, tpr, _ = roc_curve(y_test, y_test_proba)
+        roc_auc = auc(fpr, tpr)
+        roc_data.append((name, fpr, tpr, roc_auc))
+        test_predictions[name] = y_test_pred
+
+        # Classification report
+        report = classification_report(y_test, y_test_pred, output_dict=True)
+        results.append({
+            "Model": name,
+            "Accuracy": report["accuracy"],
+            "Precision (1)": report["1"]["precision"],
+            "Recall (1)": report["1"]["recall"],
+            "F1-score (1)": report["1"]["f1-score"],
+            "AUC-ROC": roc_auc,
+            "Training Time (s)": round(training_time, 2)
+        })
+
+    df_results = pd.DataFrame(results).sort_values(by="AUC-ROC", ascending=False)
+    return df_results, roc_data, test_predictions
+
+
+def make_best_xgb(**overrides):
+    """Returns an unfitted XGBoost model with the tuned hyperparameters."""
+    from xgboost import XGBClassifier
+
+    return XGBClassifier(**{**BEST_XGB_PARAMS, **overrides})
+
+
+def train_best_xgb(X_train: pd.DataFrame, y_train: pd.Series):
+    """Trains the XGBoost model with the best hyperparameters found by Optuna."""
+    best_xgb = make_best_xgb()
+    best_xgb.fit(X_train, y_train)
+    return best_xgb
+
+
+def evaluate_model(model, X_test: pd.DataFrame, y_test: pd.Series) -> tuple:
+    """
+    Evaluates a fitted model on the test set.
+
+    Returns
+    -------
+    tuple
+        (summary, y_pred, y_pred_proba) where summary holds accuracy,
+        class-1 precision/recall/F1 and AUC-ROC.
+    """
+    y_pred = model.predict(X_test)
+    y_pred_proba = model.predict_proba(X_test)[:, 1]
+
+    report_dict = classification_report(y_test, y_pred, output_dict=True)
+    summary = {
+        "Accuracy": report_dict["accuracy"],
+        "Precision (1)": report_dict["1"]["precision"],
+        "Recall (1)": report_dict["1"]["recall"],
+        "F1-score (1)": report_dict["1"]["f1-score"],
+        "AUC-ROC": roc_auc_score(y_test, y_pred_proba)
+    }
+    return summary, np.asarray(y_pred), y_pred_proba
@@ -0,0 +1,257 @@
+"""
+Hyperparameter tuning using Optuna for multiple classification models
+on the courier churn dataset.
+"""
+
+import numpy as np
+import optuna
+import pandas as pd
+from sklearn.base import clone
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.metrics import f1_score
+from sklearn.model_selection import train_test_split
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+
+from courier_churn.config import SCALED_MODELS
+
+MODEL_NAMES = ["Logistic Regression", "Decision Tree", "Random Forest",
+               "XGBoost", "LightGBM", "CatBoost", "SVM"]
+
+# Training-data fractions of the successive-halving rungs (reduction factor 3)
+DEFAULT_FRACTIONS = (1 / 9, 1 / 3, 1.0)
+
+
+def suggest_model(trial: optuna.Trial):
+    """
+    Selects a model family and samples its hyperparameters.
+
+    Returns
+    -------
+    tuple
+        (model_name, unfitted model)
+    """
+    model_name = trial.suggest_categorical("model", MODEL_NAMES)
+
+    if model_name == "Logistic Regression":
+        C = trial.suggest_float("C", 1e-3, 10.0, log=True)
+        model = LogisticRegression(C=C, max_iter=500, random_state=42)
+
+    elif model_name == "Decision Tree":
+        max_depth = trial.suggest_int("max_depth", 2, 20)
+        min_samples_split = trial.suggest_int("min_samples_split", 2, 20)
+        model = DecisionTreeClassifier(max_depth=max_depth,
+                                       min_samples_split=min_samples_split,
+                                       random_state=42)
+
+    elif model_name == "Random Forest":
+        n_estimators = trial.suggest_int("n_estimators", 50, 300)
+        max_depth = trial.suggest_int("max_depth", 2, 20)
+        model = RandomForestClassifier(n_estimators=n_estimators,
+                                       max_depth=max_depth,
+                                       random_state=42)
+
+    elif model_name == "XGBoost":
+        from xgboost import XGBClassifier
+
+        n_estimators = trial.suggest_int("n_estimators", 50, 300)
+        learning_rate = trial.suggest_float("learning_rate", 0.01, 0.3, log=True)
+        max_depth = trial.suggest_int("max_depth", 2, 20)
+        model = XGBClassifier(n_estimators=n_estimators,
+                              learning_rate=learning_rate,
+                              max_depth=max_depth,
+                              use_label_encoder=False,
+                              eval_metric="logloss",
+                              random_state=42)
+
+    elif model_name == "LightGBM":
+        from lightgbm import LGBMClassifier
+
+        n_estimators = trial.suggest_int("n_estimators", 50, 300)
+        learning_rate = trial.suggest_float("learning_rate", 0.01, 0.3, log=True)
+        max_depth = trial.suggest_int("max_depth", 2, 20)
+        model = LGBMClassifier(n_estimators=n_estimators,
+                               learning_rate=learning_rate,
+                               max_depth=max_depth,
+                               random_state=42)
+
+    elif model_name == "CatBoost":
+        from catboost import CatBoostClassifier
+
+        n_estimators = trial.suggest_int("n_estimators", 50, 300)
+        learning_rate = trial.suggest_float("learning_rate", 0.01, 0.3, log=True)
+        depth = trial.suggest_int("depth", 2, 10)
+        model = CatBoostClassifier(n_estimators=n_estimators,
+                                   learning_rate=learning_rate,
+                                   depth=depth,
+                                   verbose=0,
+                                   random_state=42)
+
+    elif model_name == "SVM":
+        C = trial.suggest_float("C", 1e-3, 10.0, log=True)
+        model = SVC(C=C, probability=True, random_state=42)
+
+    return model_name, model
+
+
+def stratified_subsamples(y: pd.Series, fractions: tuple, random_state: int = 42) -> list:
+    """
+    Precomputes nested stratified subsample indices, one per fraction.
+
+    Each class is shuffled once and every fraction takes a prefix of it, so
+    the rows of a small rung are contained in every larger rung.
+
+    Returns
+    -------
+    list
+        Sorted positional indices for every fraction.
+    """
+    rng = np.random.default_rng(random_state)
+    y = np.asarray(y)
+    class_orders = [rng.permutation(np.flatnonzero(y == label)) for label in np.unique(y)]
+    return [
+        np.sort(np.concatenate([order[:max(2, int(np.ceil(fraction * len(order))))]
+                                for order in class_orders]))
+        for fraction in fractions
+    ]
+
+
+def _take_rows(X, idx: np.ndarray):
+    """Selects rows by position from an array or a DataFrame."""
+    return X[idx] if isinstance(X, np.ndarray) else X.iloc[idx]
+
+
+def make_objective(X_train: pd.DataFrame, y_train: pd.Series, fractions: tuple = (1.0,)):
+    """
+    Builds the Optuna objective: selects a model and its hyperparameters,
+    trains on a training split and evaluates on a validation set using F1-score.
+
+    With several fractions the model is trained on growing stratified
+    subsamples of the training split and the validation F1 of each one is
+    reported, so that a successive-halving or Hyperband pruner can stop
+    unpromising trials before they reach the full data.
+    """
+    # Scale features for models sensitive to feature scale
+    X_train_scaled = StandardScaler().fit_transform(X_train)
+
+    # Train-validation split and rung subsamples are computed once for all trials
+    train_idx, val_idx = train_test_split(
+        np.arange(len(X_train)), test_size=0.2, random_state=42, stratify=y_train
+    )
+    y_train_opt, y_val = y_train.iloc[train_idx], y_train.iloc[val_idx]
+    rungs = stratified_subsamples(y_train_opt, fractions)
+    steps = rung_steps(fractions)
+    data = {
+        "scaled": (X_train_scaled[train_idx], X_train_scaled[val_idx]),
+        "raw": (X_train.iloc[train_idx], X_train.iloc[val_idx])
+    }
+
+    def objective(trial: optuna.Trial) -> float:
+        model_name, model = suggest_model(trial)
+        X_train_opt, X_val = data["scaled" if model_name in SCALED_MODELS else "raw"]
+
+        for step, idx in zip(steps, rungs):
+            # Train and evaluate model on the current rung
+            rung_model = clone(model)
+            rung_model.fit(_take_rows(X_train_opt, idx), y_train_opt.iloc[idx])
+            f1 = f1_score(y_val, rung_model.predict(X_val))
+
+            if len(rungs) > 1:
+                trial.report(f1, step)
+                if trial.should_prune():
+                    raise optuna.TrialPruned()
+
+        return f1
+
+    return objective
+
+
+def reduction_factor(fractions: tuple) -> int:
+    """
+    Validates rung fractions and returns their common integer ratio.
+
+    Fractions must be strictly ascending, end at 1.0 and be evenly spaced on a
+    geometric grid with an integer ratio of at least 2 (e.g. 1/9, 1/3, 1 or
+    0.25, 0.5, 1), so that every rung lands on a promotion point of the pruner.
+
+    Raises
+    ------
+    ValueError
+        If the fractions do not satisfy these rules.
+    """
+    fractions = np.asarray(fractions, dtype=np.float64)
+    if len(fractions) < 2:
+        raise ValueError("Multi-fidelity search needs at least two fractions.")
+    if fractions[0] <= 0 or np.any(np.diff(fractions) <= 0):
+        raise ValueError(f"Fractions must be positive and strictly ascending, got {fractions.tolist()}.")
+    if not np.isclose(fractions[-1], 1.0):
+        raise ValueError(f"The last fraction must be 1.0 (full data), got {fractions[-1]}.")
+
+    ratios = fractions[1:] / fractions[:-1]
+    factor = int(round(ratios[0]))
+    if factor < 2 or not np.allclose(ratios, factor, rtol=1e-2):
+        raise ValueError(f"Fractions must grow by the same integer factor >= 2 at every rung, "
+                         f"got ratios {np.round(ratios, 3).tolist()}.")
+    return factor
+
+
+def rung_steps(fractions: tuple) -> list:
+    """Returns the step each rung reports at, in units of the smallest fraction."""
+    return [round(fraction / fractions[0]) for fraction in fractions]
+
+
+def make_pruner(name: str, fractions: tuple):
+    """
+    Builds the pruner for a multi-fidelity search.
+
+    Parameters
+    ----------
+    name : str
+        "none", "sha" (successive halving) or "hyperband".
+    fractions : tuple
+        Rung fractions; resources are counted in units of the smallest one,
+        and the reduction factor is their common ratio.
+    """
+    if name == "none":
+        return optuna.pruners.NopPruner()
+
+    factor = reduction_factor(fractions)
+    max_resource = rung_steps(fractions)[-1]
+    if name == "sha":
+        return optuna.pruners.SuccessiveHalvingPruner(min_resource=1, reduction_factor=factor)
+    if name == "hyperband":
+        return optuna.pruners.HyperbandPruner(min_resource=1, max_resource=max_resource,
+                                              reduction_factor=factor)
+    raise ValueError(f"Unknown pruner {name!r}.")
+
+
+def run_study(X_train: pd.DataFrame, y_train: pd.Series, n_trials: int = 50,
+              pruner: str = "none", fractions: tuple = DEFAULT_FRACTIONS,
+              timeout: float = None, callbacks: list = None, seed: int = None) -> optuna.Study:
+    """
+    Launches the Optuna optimization and returns the finished study.
+
+    Parameters
+    ----------
+    pruner : str
+        "none" trains every trial on the full training split; "sha" or
+        "hyperband" train on growing subsamples given by fractions and
+        promote only the promising trials.
+    fractions : tuple
+        Rung fractions, validated by reduction_factor.
+    timeout : float
+        Optional wall-time budget in seconds.
+    callbacks : list
+        Optional Optuna callbacks invoked after every trial.
+    seed : int
+        Optional seed of the TPE sampler.
+    """
+    fractions = (1.0,) if pruner == "none" else tuple(fractions)
+    study = optuna.create_study(direction="maximize",
+                                sampler=optuna.samplers.TPESampler(seed=seed),
+                                pruner=make_pruner(pruner, fractions))
+    study.optimize(make_objective(X_train, y_train, fractions), n_trials=n_trials, timeout=timeout,
+                   callbacks=callbacks)
+    return study
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+from sklearn.cross_decomposition import PLSRegression
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from courier_churn.features import apply_pls, compile_pls
+from courier_churn.importance import compute_importance, original_feature_map
+
+
+def make_data(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, 3)), columns=["signal", "noise_1", "noise_2"])
+    y = pd.Series((2 * df["signal"] + rng.normal(scale=0.5, size=n) > 0).astype(int))
+    return df, y
+
+
+def test_permutation_picks_informative_column():
+    X, y = make_data()
+    model = LogisticRegression().fit(X, y)
+
+    df_importance = compute_importance(model, X, y, n_repeats=3, n_jobs=1)
+    for _, df_method in df_importance.groupby("method"):
+        assert df_method.iloc[0]["feature"] == "signal"
+        assert df_method.iloc[0]["importance_mean"] > 0.2
+        assert (df_method.iloc[1:]["importance_mean"].abs() < 0.02).all()
+
+
+def test_original_features_agree_for_sklearn_and_compiled_pls():
+    df, y = make_data()
+    features = df.columns.tolist()
+    scaler = StandardScaler().fit(df)
+    pls = PLSRegression(n_components=2).fit(scaler.transform(df), y)
+    X = apply_pls(df, scaler, pls, features)
+    model = LogisticRegression().fit(X, y)
+
+    results = []
+    for map_scaler, map_pls in ((scaler, pls), (None, compile_pls(scaler, pls, features))):
+        original = original_feature_map(df, map_scaler, map_pls, features, X.columns.tolist())
+        df_importance = compute_importance(model, X, y, n_repeats=2, ablation=False,
+                                           original=original, n_jobs=1)
+        results.append(df_importance[df_importance["method"] == "original"])
+
+    assert results[0].iloc[0]["feature"] == "signal"
+    np.testing.assert_allclose(results[0]["importance_mean"], results[1]["importance_mean"],
+                               atol=1e-10)
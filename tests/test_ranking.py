@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from courier_churn.ranking import TopKRanker
+
+
+def make_scores(n=1000, seed=0):
+    rng = np.random.default_rng(seed)
+    groups = pd.DataFrame({
+        "region_id": rng.integers(0, 5, size=n),
+        "hiring_channel_name": rng.choice(["Ads", "Referral", "Unknown"], size=n)
+    })
+    ids = np.arange(n)
+    # Rounded scores create ties, which are broken by courier_id
+    scores = np.round(rng.random(n), 2)
+    return groups, ids, scores
+
+
+def full_sort(groups, ids, scores, k, by):
+    frames = []
+    for col in by:
+        df = pd.DataFrame({"group": groups[col], "courier_id": ids, "churn_proba": scores})
+        df = df.sort_values(["churn_proba", "courier_id"], ascending=[False, True])
+        frames.append(df.groupby("group").head(k).assign(group_by=col))
+    return (pd.concat(frames)
+              .sort_values(["group_by", "group", "churn_proba", "courier_id"],
+                           ascending=[True, True, False, True])
+              .reset_index(drop=True)[["group_by", "group", "courier_id", "churn_proba"]])
+
+
+def normalize(df):
+    return (df.sort_values(["group_by", "group", "rank"])
+              .reset_index(drop=True)[["group_by", "group", "courier_id", "churn_proba"]])
+
+
+def test_merged_chunks_match_full_sort():
+    groups, ids, scores = make_scores()
+    by = ["region_id", "hiring_channel_name"]
+
+    ranker = TopKRanker(k=7, by=by)
+    for start in range(0, len(ids), 128):
+        chunk = slice(start, start + 128)
+        ranker.merge(TopKRanker(k=7, by=by).update(groups.iloc[chunk], ids[chunk], scores[chunk]))
+
+    expected = full_sort(groups, ids, scores, 7, by)
+    result = ranker.result()
+    pd.testing.assert_frame_equal(normalize(result), expected, check_dtype=False)
+    assert (result.groupby(["group_by", "group"])["rank"].max() <= 7).all()
+
+
+def test_missing_group_keys_share_one_block():
+    groups = pd.DataFrame({"region_id": [1.0, np.nan, 2.0, np.nan, np.nan],
+                           "hiring_channel_name": ["Ads", np.nan, "Ads", "Referral", np.nan]})
+    ranker = TopKRanker(k=1).update(groups, [1, 2, 3, 4, 5], [0.1, 0.9, 0.5, 0.8, 0.3])
+
+    result = ranker.result()
+    region_missing = result[(result["group_by"] == "region_id") & (result["group"] == "Unknown")]
+    assert region_missing["courier_id"].tolist() == [2]
+    assert result.groupby(["group_by", "group"]).size().max() == 1
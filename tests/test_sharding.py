@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from courier_churn.sharding import ShardedChurnModel
+
+
+def make_data(n_per_region=200, regions=(1, 2, 3), seed=0):
+    rng = np.random.default_rng(seed)
+    n = n_per_region * len(regions)
+    X = pd.DataFrame({"region_id": np.repeat(regions, n_per_region), "x": rng.normal(size=n)})
+    y = pd.Series((X["x"] + rng.normal(scale=0.5, size=n) > 0).astype(int))
+    return X, y
+
+
+def test_retrain_drops_region_missing_from_new_data():
+    X, y = make_data()
+    model = ShardedChurnModel(LogisticRegression, min_shard_size=100).fit(X, y, n_jobs=1)
+    assert 2 in model.shards
+
+    keep = X["region_id"] != 2
+    with pytest.warns(UserWarning, match="no longer eligible"):
+        retrained = model.retrain(X[keep], y[keep], keys=[2], n_jobs=1)
+
+    assert retrained == []
+    assert 2 not in model.shards
+    assert (model.route(X[~keep]) == ShardedChurnModel.GLOBAL).all()
+    assert model.predict_proba(X[~keep])[:, 1].std() > 0.05
+
+
+def test_retrain_drops_single_class_region():
+    X, y = make_data()
+    model = ShardedChurnModel(LogisticRegression, min_shard_size=100).fit(X, y, n_jobs=1)
+
+    y_single = y.copy()
+    y_single[X["region_id"] == 3] = 0
+    with pytest.warns(UserWarning):
+        model.retrain(X, y_single, keys=[3], n_jobs=1)
+    assert 3 not in model.shards
+
+
+def test_retrain_picks_up_newly_eligible_region():
+    X, y = make_data()
+    model = ShardedChurnModel(LogisticRegression, min_shard_size=300).fit(X, y, n_jobs=1)
+    assert list(model.shards) == [ShardedChurnModel.GLOBAL]
+
+    X_new, y_new = make_data(n_per_region=400, regions=(1,), seed=1)
+    retrained = model.retrain(pd.concat([X, X_new]), pd.concat([y, y_new]), n_jobs=1)
+    assert retrained == [1]
+    assert 1 in model.shards
+
+    # Once trained, the shard is only refit when its schedule is due
+    assert model.retrain(pd.concat([X, X_new]), pd.concat([y, y_new]), n_jobs=1) == []
+    assert set(model.due_shards(datetime.now() + timedelta(days=8))) == {ShardedChurnModel.GLOBAL, 1}
@@ -0,0 +1,50 @@
+import numpy as np
+import pandas as pd
+from sklearn.cross_decomposition import PLSRegression
+from sklearn.preprocessing import StandardScaler
+
+from courier_churn.distill import compile_logistic_student, train_logistic_student
+from courier_churn.features import apply_pls, compile_pls
+from courier_churn.student import student_design_matrix
+
+
+def test_compiled_pls_matches_scaler_and_pls():
+    rng = np.random.default_rng(0)
+    features = ["a", "b", "c", "d"]
+    df = pd.DataFrame(rng.normal(loc=5, scale=[1, 2, 3, 4], size=(300, 4)), columns=features)
+    y = (df["a"] - df["c"] + rng.normal(size=300) > 5).astype(int)
+
+    scaler = StandardScaler().fit(df[features])
+    pls = PLSRegression(n_components=2).fit(scaler.transform(df[features]), y)
+    compiled = compile_pls(scaler, pls, features)
+
+    expected = apply_pls(df, scaler, pls, features)
+    np.testing.assert_allclose(apply_pls(df, None, compiled, features), expected, atol=1e-10)
+
+
+def test_compiled_logistic_student_matches_pipeline():
+    rng = np.random.default_rng(1)
+    columns = ["PLS_1", "PLS_2", "region_id", "account_age_days"]
+    X = pd.DataFrame({
+        "PLS_1": rng.normal(size=400),
+        "PLS_2": rng.normal(scale=3, size=400),
+        "region_id": rng.integers(0, 3, size=400).astype(float),
+        "account_age_days": rng.integers(0, 100, size=400).astype(float)
+    })
+    teacher_proba = 1 / (1 + np.exp(-(X["PLS_1"] + 0.5 * X["region_id"] - 0.5).to_numpy()))
+
+    feature_idx, region_idx = [0, 1], 2
+    regions = np.array([0.0, 1.0, 2.0])
+    design = student_design_matrix(X.to_numpy(), feature_idx, region_idx, regions)
+    student = train_logistic_student(design, teacher_proba)
+    compiled = compile_logistic_student(student, columns, feature_idx, region_idx, regions)
+
+    expected = student.predict_proba(design)
+    np.testing.assert_allclose(compiled.predict_proba(X), expected, atol=1e-10)
+    np.testing.assert_allclose(compiled.predict_proba(X.to_numpy()), expected, atol=1e-10)
+
+    # Unseen regions (encoded -1) fall back to the all-zero one-hot row
+    X_unseen = X.assign(region_id=-1.0)
+    design_unseen = student_design_matrix(X_unseen.to_numpy(), feature_idx, region_idx, regions)
+    np.testing.assert_allclose(compiled.predict_proba(X_unseen),
+                               student.predict_proba(design_unseen), atol=1e-10)
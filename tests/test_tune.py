@@ -0,0 +1,45 @@
+import optuna
+import pytest
+
+from courier_churn.tune import make_pruner, reduction_factor, rung_steps
+
+
+@pytest.mark.parametrize("fractions, factor", [
+    ((1 / 9, 1 / 3, 1.0), 3),
+    ((0.25, 0.5, 1.0), 2),
+    ((0.1, 1.0), 10),
+])
+def test_reduction_factor_follows_fraction_spacing(fractions, factor):
+    assert reduction_factor(fractions) == factor
+
+
+@pytest.mark.parametrize("fractions", [
+    (1.0,),
+    (0.5, 0.25, 1.0),
+    (0.25, 0.5, 0.9),
+    (0.2, 0.5, 1.0),
+    (0.5, 0.75, 1.0),
+])
+def test_reduction_factor_rejects_invalid_fractions(fractions):
+    with pytest.raises(ValueError):
+        reduction_factor(fractions)
+
+
+@pytest.mark.parametrize("fractions", [(1 / 9, 1 / 3, 1.0), (0.25, 0.5, 1.0), (0.1, 1.0)])
+def test_rung_steps_land_on_promotion_points(fractions):
+    factor = reduction_factor(fractions)
+    assert rung_steps(fractions) == [factor ** i for i in range(len(fractions))]
+
+
+@pytest.mark.parametrize("name, pruner_type", [
+    ("none", optuna.pruners.NopPruner),
+    ("sha", optuna.pruners.SuccessiveHalvingPruner),
+    ("hyperband", optuna.pruners.HyperbandPruner),
+])
+def test_make_pruner_builds_requested_pruner(name, pruner_type):
+    assert isinstance(make_pruner(name, (0.25, 0.5, 1.0)), pruner_type)
+
+
+def test_make_pruner_rejects_invalid_fractions():
+    with pytest.raises(ValueError):
+        make_pruner("hyperband", (0.2, 0.5, 1.0))